@@ -14,24 +14,35 @@ A modular scraper for Amazon product data with:
 # ============================================================================
 
 import os
+import atexit
 import re
 import sys
 import time
-import json
+import html
+import itertools
+import orjson
+import queue
 import random
-import locale
 import requests
 import platform
+import threading
 from tqdm import tqdm
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from lxml import etree, html as lxml_html
+from lxml.html import soupparser
 from logger_config import setup_logger
-from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse, urlunparse
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlparse, urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from seleniumwire import webdriver
+from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -39,20 +50,520 @@ from selenium.common.exceptions import (
     WebDriverException,
     TimeoutException,
     NoSuchElementException,
-    ElementClickInterceptedException,
-    StaleElementReferenceException
+    ElementClickInterceptedException
 )
 
-# Fix encoding issues for Windows
-if sys.platform.startswith('win'):
-    os.environ['PYTHONIOENCODING'] = 'utf-8'
+# Standard unit -> substrings that identify it, checked in order
+UNIT_LOOKUP = tuple(
+    (standard, re.compile('|'.join(map(re.escape, variations))))
+    for standard, variations in (
+        ('GRAMS', ('gram', 'g', 'kg', 'kilogram')),
+        ('MILLILITRE', ('ml', 'millilitre', 'liter', 'l', 'litre'))
+    )
+)
+
+# Diet keyword -> label, checked in order so 'non veg' wins over 'veg'
+DIET_LOOKUP = (
+    ('vegan', 'Vegan'),
+    ('non veg', 'Non Veg'),
+    ('vegetarian', 'Veg'),
+    ('veg', 'Veg')
+)
+
+# Detail table row key (lowercase) -> field of the details record
+DETAIL_FIELD_MAP = {
+    "weight": "weight", "item weight": "weight",
+    "brand": "brand", "additives": "additives",
+    "net quantity": "net_quantity", "allergen information": "allergen_information",
+    "ingredient type": "ingredient_type", "ingredients": "ingredients",
+    "asin": "asin", "generic name": "generic_name"
+}
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one token of a space-separated class attribute"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Product page fields and search-result links, read with precompiled XPath on lxml trees
+_XPATHS = {key: etree.XPath(expr) for key, expr in {
+    'title': '//*[@id="productTitle"]',
+    'mrp': f'//span[{_has_class("a-price")} and {_has_class("a-text-price")}]'
+           f'//span[{_has_class("a-offscreen")}]',
+    'important_info': f'//*[@id="important-information"]//*[{_has_class("content")}]',
+    'breadcrumb_list': '//*[@id="wayfinding-breadcrumbs_feature_div"]//ul',
+    'breadcrumb_links': f'.//a[{_has_class("a-link-normal")} and {_has_class("a-color-tertiary")}]',
+    'main_image_src': '//*[@id="landingImage"]/@src',
+    'dynamic_image': '//*[@id="imgTagWrapperId"]//img',
+    'thumbnail_srcs': f'//li[{_has_class("image")} and {_has_class("item")}]//img/@src',
+    'color_images_script': '//script[contains(., "colorImages")]/text()',
+    # Same anchors as PRODUCT_LINK_SELECTOR, in document order
+    'search_result_links': f'(//a[{_has_class("ProductGridItem__overlay__IQ3Kw")}]'
+                           f' | //a[{_has_class("a-link-normal")} and {_has_class("s-no-outline")}]'
+                           f' | //a[contains(@class, "ProductShowcase__title__")]'
+                           f' | //div[@data-testid="small-editorial-tile"]//a)'
+                           f'[contains(@href, "/dp/")]/@href',
+    'search_next_page': f'//a[{_has_class("s-pagination-next")} and not({_has_class("s-pagination-disabled")})]/@href',
+}.items()}
+
+# Amazon detail tables: both are located in one document walk, then their
+# rows are read relative to each table
+TECH_SPEC_TABLE_ID = 'productDetails_techSpec_section_1'
+DETAIL_BULLETS_TABLE_ID = 'productDetails_detailBullets_sections1'
+DETAIL_TABLES_XPATH = etree.XPath('//*[@id=$tech or @id=$addl]')
+DETAIL_ROW_XPATH = etree.XPath('.//tr[th and td]')
+ROW_KEY_XPATH = etree.XPath('normalize-space(th)')
+ROW_VALUE_XPATH = etree.XPath('normalize-space(td)')
+
+# Server-rendered product page markers checked on plain HTTP responses
+PRODUCT_PAGE_MARKER = 'id="productTitle"'
+SEARCH_RESULTS_MARKER = 'data-component-type="s-search-result"'
+CAPTCHA_PAGE_MARKER = '/errors/validateCaptcha'
+
+# Left-to-right / right-to-left marks Amazon sprinkles through table text
+LRM, RLM = '\u200e', '\u200f'
+
+# Visible-text markers of a CAPTCHA / bot wall (lowercase)
+BLOCK_INDICATORS = [
+    'captcha', 'access denied', 'unusual traffic',
+    'enter the characters', 'i am not a robot', 'recaptcha'
+]
+
+# Same markers as one case-insensitive alternation, run as a single pass in the page
+BLOCK_INDICATOR_PATTERN = '|'.join(map(re.escape, BLOCK_INDICATORS))
+
+# Overlays that stop scraping until dismissed
+BLOCK_POPUP_SELECTOR = ", ".join([
+    'input[aria-label*="Continue shopping"]',
+    'button[aria-label*="Continue shopping"]',
+    'button[aria-label*="Dismiss"]',
+    'iframe[title="reCAPTCHA"]',
+    'div.g-recaptcha'
+])
+
+# Checks the rendered page in the browser so page_source never crosses the
+# bridge; returns [blocked text (arguments[0]), amazon_404, visible blocking
+# overlay (arguments[1])]
+PAGE_PROBE_SCRIPT = """
+const text = document.body ? document.body.innerText : '';
+const overlay = Array.from(document.querySelectorAll(arguments[1])).some(el => {
+    const style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+});
+return [
+    new RegExp(arguments[0], 'i').test(text),
+    /looking for something\\?/i.test(text) &&
+        /the web address you entered is not a functioning page/i.test(text),
+    overlay
+];
+"""
+
+# Returns the first visible element for arguments[0], a list of
+# [scope selector or null, target selector]; a scope must itself be visible
+FIRST_VISIBLE_SCRIPT = """
+const visible = el => {
+    const style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+for (const [scope, target] of arguments[0]) {
+    const root = scope ? document.querySelector(scope) : document;
+    if (!root || (scope && !visible(root))) continue;
+    for (const el of root.querySelectorAll(target)) {
+        if (visible(el)) return el;
+    }
+}
+return null;
+"""
+
+# Clicks the first visible popup control from arguments[0], a list of
+# [popup name, css selector, required text or null]; returns the popup name
+POPUP_DISMISS_SCRIPT = """
+for (const [name, css, text] of arguments[0]) {
+    for (const el of document.querySelectorAll(css)) {
+        if (!el.getClientRects().length) continue;
+        if (text && !(el.innerText || '').includes(text)) continue;
+        el.click();
+        return name;
+    }
+}
+return null;
+"""
+
+# Helpers for cleaning detail values and image URLs
+ALLERGEN_SPLIT_RE = re.compile(r'allergen information:', re.IGNORECASE)
+UNIT_DIGITS_RE = re.compile(r'[\d.]+')
+DYNAMIC_IMAGE_URL_RE = re.compile(r'"(https://[^"]+)"')
+THUMBNAIL_SIZE_RE = re.compile(r"\._.*?_\.")
+HIRES_IMAGE_RE = re.compile(r'\._AC_SL|/[^/_]+$')
+
+# Inline <script>/<style> blocks, removed before parsing (except the colorImages script)
+SCRIPT_BLOCK_RE = re.compile(r'<script\b[^<]*(?:(?!</script>)<[^<]*)*</script>', re.IGNORECASE)
+STYLE_BLOCK_RE = re.compile(r'<style\b[^<]*(?:(?!</style>)<[^<]*)*</style>', re.IGNORECASE)
+
+# hiRes and large image URLs inside the colorImages script block
+IMAGE_URL_RE = re.compile(r'"(?:hiRes|large)"\s*:\s*"([^"]+)"')
+
+# ASIN in /dp/<ASIN> and /gp/product/<ASIN> product URLs
+ASIN_RE = re.compile(r'/(?:dp|gp/product)/([A-Z0-9]{10})')
+
+# Product links across the different listing layouts, filtered to /dp/ pages
+PRODUCT_LINK_SELECTOR = ", ".join([
+    'a.ProductGridItem__overlay__IQ3Kw[href*="/dp/"]',
+    'a.a-link-normal.s-no-outline[href*="/dp/"]',
+    'a[class*="ProductShowcase__title__"][href*="/dp/"]',
+    'div[data-testid="small-editorial-tile"] a[href*="/dp/"]'
+])
+
+# Present once a product page has rendered the parts the extractors read
+PRODUCT_READY_SELECTOR = (
+    '#productDetails_techSpec_section_1, #productDetails_detailBullets_sections1, #landingImage'
+)
+
+# Waits in the page for the `required` selector, then up to optionalMs more for
+# `optional` (may be null). Resolves with [requiredFound, optionalFound] without
+# any WebDriver polling; gives up on `required` after requiredMs.
+WAIT_FOR_SELECTORS_SCRIPT = """
+const [required, optional, requiredMs, optionalMs, done] = arguments;
+const start = performance.now();
+let requiredAt = null;
+let finished = false;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    done(result);
+}
+
+function check() {
+    const now = performance.now();
+    const hasRequired = document.querySelector(required) !== null;
+    const hasOptional = !optional || document.querySelector(optional) !== null;
+    if (hasRequired && requiredAt === null) requiredAt = now;
+    if (hasRequired && (hasOptional || now - requiredAt >= optionalMs)) finish([true, hasOptional]);
+    else if (!hasRequired && now - start >= requiredMs) finish([false, hasOptional]);
+}
+
+const observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+const timer = setInterval(check, 250);
+check();
+"""
+
+# Returns the unique absolute URLs (without /ref= suffix) matching arguments[0]
+PRODUCT_LINK_SCRIPT = """
+const urls = new Set();
+for (const a of document.querySelectorAll(arguments[0])) {
+    urls.add(a.href.split('/ref=')[0]);
+}
+return Array.from(urls);
+"""
+
+# Scrolls the listing until the page stops growing for arguments[4] rounds
+# (or arguments[5] ms in total), clicking the load-more button (arguments[0])
+# whenever it is visible. Each round scrolls to just above the footer and waits
+# for the DOM to be quiet for arguments[1] ms (arguments[2] ms grace before the
+# first mutation, arguments[3] ms at most). Resolves with the final scrollHeight.
+LOAD_ALL_PRODUCTS_SCRIPT = """
+const [buttonSelector, quietMs, graceMs, stepMs, maxStableRounds, totalMs, done] = arguments;
+
+function settle(target) {
+    return new Promise(resolve => {
+        let quiet = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(finish, quietMs);
+        });
+        const cap = setTimeout(finish, stepMs);
+        function finish() {
+            clearTimeout(quiet);
+            clearTimeout(cap);
+            observer.disconnect();
+            resolve(document.body.scrollHeight);
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+        quiet = setTimeout(finish, graceMs);
+        window.scrollTo(0, target);
+    });
+}
+
+(async () => {
+    const deadline = Date.now() + totalMs;
+    let last = document.body.scrollHeight;
+    let stable = 0;
+    while (stable < maxStableRounds && Date.now() < deadline) {
+        const footer = document.getElementById('navFooter');
+        const offset = 600 + Math.floor(Math.random() * 100);
+        const height = await settle(last - (footer ? footer.offsetHeight : 0) - offset);
+
+        const button = document.querySelector(buttonSelector);
+        if (button && button.getClientRects().length) {
+            button.click();
+        }
+
+        if (height === last) {
+            stable++;
+        } else {
+            last = height;
+            stable = 0;
+        }
+    }
+    done(last);
+})();
+"""
+
+def _strip_irrelevant_html(html: str) -> str:
+    """Drop style blocks and every script except the colorImages one before parsing"""
+    html = STYLE_BLOCK_RE.sub('', html)
+    return SCRIPT_BLOCK_RE.sub(lambda m: m.group(0) if 'colorImages' in m.group(0) else '', html)
+
+
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml_html.HTMLParser:
+    """Per-thread lxml parser that never builds comment or processing-instruction nodes"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+    return parser
+
+
+def _make_tree(html: str):
+    """Parse page HTML with libxml2, falling back to BeautifulSoup for markup lxml rejects"""
     try:
-        locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-    except locale.Error:
+        return lxml_html.fromstring(html, parser=_html_parser())
+    except (etree.ParserError, etree.XMLSyntaxError):
+        return soupparser.fromstring(html)
+
+
+def _element_text(element) -> str:
+    """Whitespace-separated text of an element, like bs4's get_text(' ', strip=True)"""
+    return ' '.join(text.strip() for text in element.itertext() if text.strip())
+
+
+CHROMEDRIVER_SENTINEL = os.path.join(os.path.expanduser('~'), '.cache', 'product-scraper', 'driver.json')
+CHROMEDRIVER_SENTINEL_MAX_AGE = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def _installed_chromedriver_path() -> str:
+    """Resolve chromedriver once per process, reusing the path found by earlier runs for up to a week"""
+    try:
+        with open(CHROMEDRIVER_SENTINEL, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if time.time() - cached['ts'] < CHROMEDRIVER_SENTINEL_MAX_AGE and os.path.exists(cached['path']):
+            return cached['path']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_SENTINEL), exist_ok=True)
+        with open(CHROMEDRIVER_SENTINEL, 'wb') as f:
+            f.write(orjson.dumps({'path': path, 'ts': time.time()}))
+    except OSError:
+        pass  # cache is best-effort; the driver path itself is fine
+    return path
+
+
+def _strip_bidi(text: str) -> str:
+    """Remove LRM/RLM marks; two C-level replace() scans beat both re.sub and str.translate here"""
+    return text.replace(LRM, '').replace(RLM, '')
+
+
+def _table_rows(table) -> List[Tuple[str, str]]:
+    """Return (lowercased key, value) pairs for the th/td rows of a detail table"""
+    rows = []
+    for row in DETAIL_ROW_XPATH(table):
+        key = _strip_bidi(ROW_KEY_XPATH(row)).strip().lower()
+        value = _strip_bidi(ROW_VALUE_XPATH(row)).strip()
+        rows.append((key, value))
+    return rows
+
+
+# ============================================================================
+# PRODUCT PAGE
+# ============================================================================
+
+class ProductPage:
+    """Product page HTML parsed once and shared by every extractor.
+
+    The lxml tree and the detail table rows are each built on first access and
+    cached for the remaining extractors.
+    """
+
+    __slots__ = ('html', '_tree', '_tech_rows', '_addl_rows')
+
+    def __init__(self, html: str):
+        self.html = html
+        self._tree = None
+        self._tech_rows = None
+        self._addl_rows = None
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = _make_tree(self.html)
+        return self._tree
+
+    def xpath(self, key: str, node=None) -> list:
+        """Run a precompiled _XPATHS expression on the page, or relative to node"""
+        return _XPATHS[key](self.tree if node is None else node)
+
+    def first(self, key: str, node=None):
+        """First result of xpath(key, node), or None"""
+        results = self.xpath(key, node)
+        return results[0] if results else None
+
+    @property
+    def tech_rows(self) -> List[Tuple[str, str]]:
+        if self._tech_rows is None:
+            self._load_detail_tables()
+        return self._tech_rows
+
+    @property
+    def addl_rows(self) -> List[Tuple[str, str]]:
+        if self._addl_rows is None:
+            self._load_detail_tables()
+        return self._addl_rows
+
+    def _load_detail_tables(self):
+        """Read both detail tables with a single search of the document"""
+        tables = {TECH_SPEC_TABLE_ID: [], DETAIL_BULLETS_TABLE_ID: []}
+        for table in DETAIL_TABLES_XPATH(self.tree, tech=TECH_SPEC_TABLE_ID, addl=DETAIL_BULLETS_TABLE_ID):
+            tables[table.get('id')].extend(_table_rows(table))
+        self._tech_rows = tables[TECH_SPEC_TABLE_ID]
+        self._addl_rows = tables[DETAIL_BULLETS_TABLE_ID]
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate_per_sec` sustained, up to `burst` at once"""
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# ============================================================================
+# BROWSER POOL
+# ============================================================================
+
+class BrowserPool:
+    """
+    Pool of up to `size` Chrome WebDrivers shared by worker threads.
+    Drivers are started on first checkout, so a run served entirely over HTTP
+    never launches one. Each driver is used by one thread at a time and
+    recycled after max_uses.
+    """
+
+    def __init__(self, factory, size: int, max_uses: int, logger):
+        self._factory = factory
+        self._size = size
+        self._max_uses = max_uses
+        self.logger = logger
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._starting = 0
+        self._lock = threading.Lock()
+        # Quit pooled Chromes even if the run dies before close() is reached
+        atexit.register(self.close)
+
+    def __len__(self) -> int:
+        return len(self._uses)
+
+    def _acquire(self):
+        """An idle driver, a newly started one while below size, or the next one returned"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_start = len(self._uses) + self._starting < self._size
+            if can_start:
+                self._starting += 1
+        if not can_start:
+            return self._idle.get()
+
+        try:
+            driver = self._factory()
+        except WebDriverException as e:
+            with self._lock:
+                self._starting -= 1
+                running = bool(self._uses)
+            self.logger.error(f"Failed to start pooled WebDriver: {e}")
+            if not running:  # no driver that could be returned to wait for
+                raise
+            return self._idle.get()
+
+        with self._lock:
+            self._starting -= 1
+            self._uses[driver] = 0
+        self.logger.info(f"Started pooled WebDriver {len(self._uses)}/{self._size}.")
+        return driver
+
+    @contextmanager
+    def checkout(self):
+        """Borrow a driver for the duration of the with-block"""
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            self._uses[driver] += 1
+            if self._uses[driver] >= self._max_uses:
+                driver = self._recycle(driver)
+            self._idle.put(driver)
+
+    def _recycle(self, driver):
+        """Replace a worn-out driver, keeping the old one if a new one can't start"""
         try:
-            locale.setlocale(locale.LC_ALL, 'C.UTF-8')
-        except locale.Error:
+            fresh = self._factory()
+        except WebDriverException as e:
+            self.logger.warning(f"Could not recycle pooled WebDriver, reusing it: {e}")
+            self._uses[driver] = 0
+            return driver
+
+        with self._lock:
+            del self._uses[driver]
+            self._uses[fresh] = 0
+        try:
+            driver.quit()
+        except WebDriverException:
             pass
+        self.logger.info("Recycled pooled WebDriver.")
+        return fresh
+
+    def close(self):
+        """Quit every driver owned by the pool"""
+        atexit.unregister(self.close)
+        for driver in list(self._uses):
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self._uses.clear()
 
 
 # ============================================================================
@@ -67,10 +578,39 @@ class Amazon:
     def __init__(self, headless: bool = True, base_url: str = "https://www.amazon.in/"):
         """Initialize the Amazon scraper"""
         self._setup_logging()
+        self._local = threading.local()
         self.headless = headless
         self.driver = None
+        self.browser_pool = None
         self.BASE_URL = base_url
         self._configure_constants()
+        self._limiter = TokenBucket(self.RATE_LIMIT_PER_SEC, self.RATE_LIMIT_BURST)
+        self._pending: List[Dict[str, Any]] = []
+        self._insert_batch_size = self.INSERT_BATCH_SIZE
+        self._bulk_insert_supported = True
+        self._insert_retries = 0
+        self._retry_after = 0.0  # no flush before this monotonic time once a batch is held for retry
+        # Inserts run on their own thread so API latency overlaps with page loads
+        self._insert_queue: queue.Queue = queue.Queue()
+        self._last_insert_ok = True
+        # Products the API has accepted / that were lost, counted on the insert thread
+        self._inserted_count = 0
+        self._insert_error_count = 0
+        threading.Thread(target=self._insert_worker, name="api-insert", daemon=True).start()
+        # Parsed products by ASIN, so a product reached through several URLs is fetched once
+        self._details_cache: Dict[str, Dict[str, Any]] = {}
+        self._details_cache_lock = threading.Lock()
+
+    @property
+    def driver(self):
+        """WebDriver bound to the calling thread"""
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value):
+        if value is not getattr(self._local, 'driver', None):
+            self._local.page_probe = None
+        self._local.driver = value
 
     # ========================================================================
     # CONFIGURATION AND SETUP METHODS
@@ -83,6 +623,31 @@ class Amazon:
     def _configure_constants(self):
         """Initialize scraper constants and configuration"""
         self.API_ENDPOINT = "http://10.0.101.117:1001/insert"
+        self.BULK_INSERT_URL = "http://10.0.101.117:1001/insert_bulk"
+        self.INSERT_BATCH_SIZE = 32
+        self.INSERT_MAX_WAIT = 5.0  # seconds a product may sit in the buffer
+        self.INSERT_MAX_RETRIES = 3  # flushes a batch may fail on network errors before it is dropped
+
+        # Keep-alive session reused for every API insert
+        self.api_session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+        self.api_session.mount('http://', adapter)
+        self.api_session.mount('https://', adapter)
+
+        # Plain HTTP session for product pages that render server-side; it takes
+        # over the warmed-up browser's cookies and user agent in _sync_page_session
+        self.HTTP_FETCH_TIMEOUT = 10
+        self.HTTP_WORKERS = 16  # product threads; browser fallbacks still queue on the pool
+        self.page_session = requests.Session()
+        page_adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 504))
+        )
+        self.page_session.mount('https://', page_adapter)
+        self.page_session.headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-IN,en;q=0.9',
+        })
 
         self.USER_AGENTS = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36',
@@ -93,34 +658,53 @@ class Amazon:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36 Brave/1.43.88',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36 Vivaldi/5.8.2945.60'
         ]
+        self._ua_cycle = itertools.cycle(random.sample(self.USER_AGENTS, len(self.USER_AGENTS)))
 
         # Timing and retry configuration
         self.MAX_SCROLL_RETRIES = 5
         self.SCROLL_PAUSE_TIME = 4
+        self.SCROLL_SETTLE_MS = 500
+        self.SCROLL_SETTLE_GRACE_MS = 2000
+        self.SCROLL_SETTLE_MAX_MS = 8000
+        self.SCROLL_TOTAL_MAX_MS = 180000
         self.MAX_RETRIES = 3
         self.PAGE_LOAD_TIMEOUT = 30
         self.REQUEST_TIMEOUT = 30
         self.ELEMENT_WAIT_TIMEOUT = 15
 
+        # Popup controls tried in order by a single in-page dismiss script
+        self.POPUP_DISMISS_TARGETS = self._popup_dismiss_targets()
+
+        # Sub-resources never read by the scraper (images come from page JSON/attributes)
+        self.BLOCKED_RESOURCE_EXTENSIONS = (
+            '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
+            '.woff', '.woff2', '.ttf', '.otf', '.mp4', '.webm'
+        )
+
+        # Browser pool configuration
+        self.POOL_SIZE = 3
+        self.MAX_USES_PER_INSTANCE = 50
+
+        # Product page request budget shared by all pooled browsers
+        self.RATE_LIMIT_PER_SEC = 0.3
+        self.RATE_LIMIT_BURST = 4
+
+        # Products remembered by ASIN for duplicate listing URLs
+        self.DETAILS_CACHE_SIZE = 4096
+
     def _get_random_user_agent(self) -> str:
-        """Return a random user agent from predefined list"""
-        return random.choice(self.USER_AGENTS)
+        """Return the next user agent from a shuffled rotation, so pooled drivers differ"""
+        return next(self._ua_cycle)
 
     # ========================================================================
     # WEBDRIVER INITIALIZATION AND MANAGEMENT
     # ========================================================================
 
     def init_driver(self) -> bool:
-        """Initialize and return a Chrome WebDriver"""
+        """Initialize the Chrome WebDriver for the calling thread"""
         try:
-            chrome_driver_path_windows = r"C:\path\to\chromedriver.exe"
-            chrome_driver_path_ubuntu = "/usr/local/bin/chromedriver"
-
-            options = self._configure_chrome_options()
-            service = self._get_chrome_service(chrome_driver_path_windows, chrome_driver_path_ubuntu)
-
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+            self.driver = self._create_driver()
+            atexit.register(self._cleanup)
             self.logger.info("WebDriver initialized successfully.")
             return True
 
@@ -128,6 +712,47 @@ class Amazon:
             self.logger.error(f"FATAL: WebDriver initialization failed. Error: {e}")
             return False
 
+    def _create_driver(self):
+        """Create and return a configured Chrome WebDriver"""
+        chrome_driver_path_windows = r"C:\path\to\chromedriver.exe"
+        chrome_driver_path_ubuntu = "/usr/local/bin/chromedriver"
+
+        options = self._configure_chrome_options()
+        service = self._get_chrome_service(chrome_driver_path_windows, chrome_driver_path_ubuntu)
+
+        driver = webdriver.Chrome(service=service, options=options)
+        self._block_heavy_resources(driver)
+        driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+        # In-page readiness waits time themselves out; leave them room to do so
+        driver.set_script_timeout(self.PAGE_LOAD_TIMEOUT + self.ELEMENT_WAIT_TIMEOUT + 5)
+        return driver
+
+    def _create_warm_driver(self):
+        """Create a pooled driver that has already been through the homepage and its popups,
+        so a browser fallback does not land on a fresh, cookieless session"""
+        driver = self._create_driver()
+        previous = self.driver
+        self.driver = driver
+        try:
+            if self._navigate_to_homepage():
+                self._handle_homepage_popups()
+            else:
+                self.logger.warning("Pooled WebDriver started without a homepage warm-up.")
+        finally:
+            self.driver = previous
+        return driver
+
+    def _block_heavy_resources(self, driver):
+        """Have Chrome drop image, font and media requests before they are sent"""
+        patterns = []
+        for ext in self.BLOCKED_RESOURCE_EXTENSIONS:
+            patterns.extend((f"*{ext}", f"*{ext}?*"))
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except WebDriverException as e:
+            self.logger.warning(f"Could not enable resource blocking: {e}")
+
     def _configure_chrome_options(self):
         """Configure Chrome options for the WebDriver"""
         options = webdriver.ChromeOptions()
@@ -148,6 +773,21 @@ class Amazon:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
 
+        # Skip image and font downloads; stylesheets stay on since scrolling
+        # and popup visibility checks depend on layout
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        # Larger disk cache so the shared page shell is reused across products
+        options.add_argument('--disk-cache-size=104857600')
+
+        # Return from get() at DOMContentLoaded; callers wait for the elements they need
+        options.page_load_strategy = 'eager'
+
         # Security and performance options
         options.add_argument('--disable-extensions')
         options.add_argument('--disable-web-security')
@@ -167,7 +807,7 @@ class Amazon:
                 return Service(windows_path)
             else:
                 print("Installing ChromeDriver (Windows)")
-                return Service(ChromeDriverManager().install())
+                return Service(_installed_chromedriver_path())
 
         elif system_os == "Linux":
             if os.path.exists(ubuntu_path):
@@ -175,9 +815,9 @@ class Amazon:
                 return Service(ubuntu_path)
             else:
                 print("Installing ChromeDriver (Ubuntu/Linux)")
-                return Service(ChromeDriverManager().install())
+                return Service(_installed_chromedriver_path())
         else:
-            return Service(ChromeDriverManager().install())
+            return Service(_installed_chromedriver_path())
 
     # ========================================================================
     # NAVIGATION AND INTERACTION UTILITIES
@@ -185,6 +825,7 @@ class Amazon:
 
     def _safe_click(self, element) -> bool:
         """Safely clicks an element using multiple strategies"""
+        self._invalidate_page_probe()
         try:
             element.click()
             return True
@@ -205,7 +846,7 @@ class Amazon:
         for attempt in range(self.MAX_RETRIES):
             try:
                 self.logger.info(f"Navigation attempt {attempt + 1}/{self.MAX_RETRIES}")
-                self.driver.get(url)
+                self._navigate(url)
                 WebDriverWait(self.driver, self.ELEMENT_WAIT_TIMEOUT).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
@@ -241,27 +882,18 @@ class Amazon:
         """Handles modal overlays and Amazon 404 error redirects"""
         try:
             # Handle modal overlays
-            overlay_selectors = [
-                '.a-modal-scroller',
-                '.a-popover-wrapper',
-                '[data-action="a-modal-close"]',
-                '.a-declarative[data-action="close"]'
-            ]
-
-            for selector in overlay_selectors:
-                try:
-                    overlay = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if overlay.is_displayed():
-                        close_buttons = overlay.find_elements(By.CSS_SELECTOR,
-                                                              'button[aria-label*="Close"], button[title*="Close"], .a-button-close')
-                        for button in close_buttons:
-                            if button.is_displayed():
-                                self._safe_click(button)
-                                self.logger.info("Closed modal overlay.")
-                                time.sleep(1)
-                                return True
-                except (NoSuchElementException, StaleElementReferenceException):
-                    continue
+            close_button = 'button[aria-label*="Close"], button[title*="Close"], .a-button-close'
+            button = self._first_visible([
+                ['.a-modal-scroller', close_button],
+                ['.a-popover-wrapper', close_button],
+                ['[data-action="a-modal-close"]', close_button],
+                ['.a-declarative[data-action="close"]', close_button]
+            ])
+            if button is not None:
+                self._safe_click(button)
+                self.logger.info("Closed modal overlay.")
+                time.sleep(1)
+                return True
 
             # Handle 404 page redirects
             return self._handle_404_redirects()
@@ -273,18 +905,14 @@ class Amazon:
     def _handle_404_redirects(self) -> bool:
         """Handle Amazon 404 page redirects"""
         try:
-            page_source = self.driver.page_source.lower()
-            if ('looking for something?' in page_source and
-                'the web address you entered is not a functioning page' in page_source):
-                try:
-                    link = self.driver.find_element(By.CSS_SELECTOR, 'a[href="/ref=cs_404_link"]')
-                    if link.is_displayed():
-                        self._safe_click(link)
-                        self.logger.warning("Detected 404 page. Redirecting to Amazon home page...")
-                        time.sleep(2)
-                        return True
-                except NoSuchElementException:
-                    pass
+            _, not_found, _ = self._probe_page()
+            if not_found:
+                link = self._first_visible([[None, 'a[href="/ref=cs_404_link"]']])
+                if link is not None:
+                    self._safe_click(link)
+                    self.logger.warning("Detected 404 page. Redirecting to Amazon home page...")
+                    time.sleep(2)
+                    return True
         except Exception as e:
             self.logger.error(f"Error checking Amazon 404 page: {e}")
         return False
@@ -295,42 +923,12 @@ class Amazon:
 
         try:
             time.sleep(2)
-            popup_selectors = self._get_popup_selectors()
-            wait = WebDriverWait(self.driver, 5)
-
-            for popup_type in popup_selectors:
-                popup_name = popup_type['name']
-                self.logger.info(f"Checking for {popup_name} popup...")
-
-                for selector in popup_type['selectors']:
-                    try:
-                        if selector.startswith('button:contains') or selector.startswith('span'):
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector.split(':')[0])
-                            for element in elements:
-                                if selector.split('"')[1] in element.text:
-                                    self.logger.info(f"Found {popup_name} button: '{element.text}'")
-                                    self._safe_click(element)
-                                    popup_handled = True
-                                    time.sleep(2)
-                                    break
-                        else:
-                            element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                            if element:
-                                self.logger.info(f"Found {popup_name} button")
-                                self._safe_click(element)
-                                popup_handled = True
-                                time.sleep(2)
-                                break
-
-                    except (TimeoutException, NoSuchElementException):
-                        continue  # Try next selector
-                    except Exception as e:
-                        self.logger.debug(f"Error with selector {selector}: {e}")
-                        continue
-
-                if popup_handled:
-                    self.logger.info(f"Successfully handled {popup_name}")
-                    break
+            popup_name = self.driver.execute_script(POPUP_DISMISS_SCRIPT, self.POPUP_DISMISS_TARGETS)
+            if popup_name:
+                self._invalidate_page_probe()
+                popup_handled = True
+                self.logger.info(f"Successfully handled {popup_name}")
+                time.sleep(2)
 
             if not popup_handled:
                 self._handle_modal_overlays()
@@ -340,6 +938,25 @@ class Amazon:
 
         return popup_handled
 
+    def _first_visible(self, targets: List[List[Optional[str]]]) -> Optional[WebElement]:
+        """First visible element for [scope, selector] pairs, found in one browser call"""
+        try:
+            return self.driver.execute_script(FIRST_VISIBLE_SCRIPT, targets)
+        except WebDriverException as e:
+            self.logger.debug(f"Visibility query failed: {e}")
+            return None
+
+    def _popup_dismiss_targets(self) -> List[List[Optional[str]]]:
+        """Flatten popup selectors into [name, css, text] entries for POPUP_DISMISS_SCRIPT"""
+        targets = []
+        for popup_type in self._get_popup_selectors():
+            for selector in popup_type['selectors']:
+                if ':contains(' in selector:
+                    targets.append([popup_type['name'], selector.split(':')[0], selector.split('"')[1]])
+                else:
+                    targets.append([popup_type['name'], selector, None])
+        return targets
+
     def _get_popup_selectors(self) -> List[Dict]:
         """Streamlined popup selector configurations with most common ones first"""
         return [
@@ -384,28 +1001,6 @@ class Amazon:
             }
         ]
 
-    def _handle_popup_selector(self, selector: str, popup_name: str, wait) -> bool:
-        """Handle individual popup selector"""
-        try:
-            if selector.startswith('button:contains') or selector.startswith('span'):
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector.split(':')[0])
-                for element in elements:
-                    if selector.split('"')[1] in element.text:
-                        self.logger.info(f"Found {popup_name} button: '{element.text}'")
-                        self._safe_click(element)
-                        time.sleep(2)
-                        return True
-            else:
-                element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                if element:
-                    self.logger.info(f"Found {popup_name} button")
-                    self._safe_click(element)
-                    time.sleep(2)
-                    return True
-        except Exception as e:
-            self.logger.debug(f"Error with selector {selector}: {e}")
-        return False
-
     # ========================================================================
     # BOT DETECTION AND SECURITY
     # ========================================================================
@@ -413,52 +1008,48 @@ class Amazon:
     def _check_for_blocks(self) -> bool:
         """Detects if the page is blocked by CAPTCHA, access denial, or 404 errors"""
         try:
-            page_source = self.driver.page_source.lower()
-
-            # Page source block indicators
-            block_indicators = [
-                'captcha', 'access denied', 'unusual traffic',
-                'enter the characters', 'i am not a robot', 'recaptcha'
-            ]
+            blocked, not_found, overlay = self._probe_page()
 
-            if any(indicator in page_source for indicator in block_indicators):
-                self.logger.warning("Page source contains block indicators.")
+            # Page text block indicators
+            if blocked:
+                self.logger.warning("Page contains block indicators.")
                 return True
 
             # Amazon 404 error block
-            if ('looking for something?' in page_source and
-                'the web address you entered is not a functioning page' in page_source):
+            if not_found:
                 self.logger.warning("Amazon 404 page detected.")
                 return True
 
-            # Check for popup elements
-            return self._check_popup_elements()
+            # Blocking overlays (continue-shopping, reCAPTCHA)
+            if overlay:
+                self.logger.debug("Blocking element detected.")
+            return overlay
 
         except Exception as e:
             self.logger.error(f"Error during block check: {e}")
             return False
 
-    def _check_popup_elements(self) -> bool:
-        """Fast popup element detection without timeouts"""
-        priority_selectors = [
-            'input[aria-label*="Continue shopping"]',
-            'button[aria-label*="Continue shopping"]',
-            'button[aria-label*="Dismiss"]',
-            'iframe[title="reCAPTCHA"]',
-            'div.g-recaptcha'
-        ]
+    def _probe_page(self) -> Tuple[bool, bool, bool]:
+        """Return (blocked, amazon_404, blocking_overlay) for the page in one browser call.
 
-        try:
-            for selector in priority_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for el in elements:
-                    if el.is_displayed():
-                        self.logger.debug(f"Blocking element detected: {selector}")
-                        return True
-            return False
-        except Exception as e:
-            self.logger.debug(f"Error in popup element check: {e}")
-            return False
+        The result is cached until the next navigation or click on this thread.
+        """
+        probe = getattr(self._local, 'page_probe', None)
+        if probe is None:
+            blocked, not_found, overlay = self.driver.execute_script(
+                PAGE_PROBE_SCRIPT, BLOCK_INDICATOR_PATTERN, BLOCK_POPUP_SELECTOR
+            )
+            probe = self._local.page_probe = (bool(blocked), bool(not_found), bool(overlay))
+        return probe
+
+    def _invalidate_page_probe(self):
+        """Forget the cached page probe once the page may have changed"""
+        self._local.page_probe = None
+
+    def _navigate(self, url: str):
+        """Load url in the current driver and drop state tied to the previous page"""
+        self._invalidate_page_probe()
+        self.driver.get(url)
 
     def _perform_warmup_and_get(self, target_url: str) -> bool:
         """Performs safe navigation protocol with warmup"""
@@ -483,7 +1074,11 @@ class Amazon:
 
             # Step 4: Navigate to target
             self.logger.info(f"Step 4/4: Navigating to target URL: {target_url}")
-            return self._navigate_to_target(target_url)
+            if not self._navigate_to_target(target_url):
+                return False
+
+            self._sync_page_session()
+            return True
 
         except Exception as e:
             self.logger.error(f"Navigation protocol failed: {e}", exc_info=True)
@@ -492,7 +1087,7 @@ class Amazon:
     def _navigate_to_homepage(self) -> bool:
         """Navigate to homepage and verify load"""
         try:
-            self.driver.get(self.BASE_URL)
+            self._navigate(self.BASE_URL)
             WebDriverWait(self.driver, self.PAGE_LOAD_TIMEOUT).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
@@ -511,14 +1106,13 @@ class Amazon:
     def _navigate_to_target(self, target_url: str) -> bool:
         """Navigate to target URL and verify success"""
         try:
-            self.driver.get(target_url)
+            self._navigate(target_url)
             WebDriverWait(self.driver, self.PAGE_LOAD_TIMEOUT).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
 
-            post_load_delay = random.uniform(2, 4)
-            self.logger.info(f"Waiting {post_load_delay:.2f} seconds for dynamic content")
-            time.sleep(post_load_delay)
+            self.logger.info("Waiting for product content")
+            self._wait_for_content(f"{PRODUCT_READY_SELECTOR}, {PRODUCT_LINK_SELECTOR}")
 
             current_url = self.driver.current_url
             if "amazon" in current_url.lower():
@@ -533,6 +1127,27 @@ class Amazon:
             self.logger.error(f"Failed to navigate to target: {e}")
             return False
 
+    def _wait_for_content(self, selector: str) -> bool:
+        """Wait until an element matching selector is present; carry on without it on timeout"""
+        found, _ = self._wait_for_selectors(selector, timeout=self.ELEMENT_WAIT_TIMEOUT)
+        if not found:
+            self.logger.debug(f"Timed out waiting for {selector}")
+        return found
+
+    def _wait_for_selectors(self, required: str, optional: Optional[str] = None,
+                            timeout: Optional[float] = None) -> Tuple[bool, bool]:
+        """Wait in one browser call for `required`, then briefly for `optional`; returns what was found"""
+        timeout = self.PAGE_LOAD_TIMEOUT if timeout is None else timeout
+        try:
+            found = self.driver.execute_async_script(
+                WAIT_FOR_SELECTORS_SCRIPT, required, optional,
+                timeout * 1000, self.ELEMENT_WAIT_TIMEOUT * 1000
+            )
+            return bool(found[0]), bool(found[1])
+        except WebDriverException as e:
+            self.logger.debug(f"Readiness wait for {required} failed: {e}")
+            return False, False
+
     # ========================================================================
     # TEXT PROCESSING AND UTILITY METHODS
     # ========================================================================
@@ -542,80 +1157,65 @@ class Amazon:
         """Clean text by removing special characters and extra whitespace"""
         if not text:
             return ""
-        return re.sub(r'[\u200e\u200f]', '', text).strip()
+        return _strip_bidi(text).strip()
 
-    def get_mass_measurement_unit(self, unit: str):
+    def _xpath_text(self, page: ProductPage, key: str) -> Optional[str]:
+        """Return cleaned text of the first element matching an _XPATHS entry, or None"""
+        element = page.first(key)
+        return self._clean_text(element.text_content()) if element is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def get_mass_measurement_unit(unit: str):
         """Extract and standardize mass or volume measurement unit"""
         if not unit:
             return None
-        cleaned_unit = re.sub(r'[\d\.]+', '', str(unit)).strip().lower()
-        unit_mappings = {
-            'GRAMS': ['gram', 'g', 'kg', 'kilogram'],
-            'MILLILITRE': ['ml', 'millilitre', 'liter', 'l', 'litre']
-        }
-        for standard, variations in unit_mappings.items():
-            if any(var in cleaned_unit for var in variations):
+        cleaned_unit = UNIT_DIGITS_RE.sub('', str(unit)).strip().lower()
+        for standard, pattern in UNIT_LOOKUP:
+            if pattern.search(cleaned_unit):
                 return standard
         return None
 
-    def get_diet(self, diet: str):
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def get_diet(diet: str):
         """Standardize diet information"""
         if not diet:
             return None
         diet = diet.lower()
-        if 'vegan' in diet:
-            return "Vegan"
-        if 'non veg' in diet:
-            return 'Non Veg'
-        if 'vegetarian' in diet or 'veg' in diet:
-            return 'Veg'
+        for keyword, label in DIET_LOOKUP:
+            if keyword in diet:
+                return label
         return None
 
     def extract_image_urls_text(self, image_urls) -> str:
-        """Convert image URLs list to JSON string"""
-        if not image_urls or not isinstance(image_urls, list):
+        """Convert an iterable of image URLs to a JSON string, keeping page order"""
+        if not image_urls:
             return ""
         valid_urls = [url for url in image_urls if isinstance(url, str) and url.startswith("http")]
-        return json.dumps({"image_urls": valid_urls}, indent=2) if valid_urls else ""
+        if not valid_urls:
+            return ""
+        return orjson.dumps({"image_urls": valid_urls}).decode()
 
     # ========================================================================
     # PAGE INTERACTION AND SCROLLING
     # ========================================================================
 
     def _load_all_products(self) -> None:
-        """Scrolls down the page to load all products"""
-        time.sleep(self.SCROLL_PAUSE_TIME + random.random())
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        footer_height = self.driver.execute_script(
-            "return document.getElementById('navFooter') ? document.getElementById('navFooter').offsetHeight : 0;")
-        retries = 0
-
-        while retries < self.MAX_SCROLL_RETRIES:
-            try:
-                wait = WebDriverWait(self.driver, 10)
-                scroll_position = last_height - footer_height - random.randint(600, 700)
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                time.sleep(self.SCROLL_PAUSE_TIME + random.randint(3, 6))
-
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-                # Try to click load more button if available
-                try:
-                    button = wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "button.Button__secondary__sMAVa")))
-                    button.click()
-                except:
-                    pass
-
-                if new_height == last_height:
-                    retries += 1
-                else:
-                    last_height = new_height
-                    retries = 0
-
-            except Exception as e:
-                self.logger.error(f"Error during scrolling: {e}")
-                break
+        """Scrolls down the page to load all products, driven by one in-page script"""
+        self.driver.set_script_timeout(self.SCROLL_TOTAL_MAX_MS / 1000 + self.SCROLL_SETTLE_MAX_MS / 1000 + 5)
+        try:
+            self.driver.execute_async_script(
+                LOAD_ALL_PRODUCTS_SCRIPT,
+                "button.Button__secondary__sMAVa",
+                self.SCROLL_SETTLE_MS,
+                self.SCROLL_SETTLE_GRACE_MS,
+                self.SCROLL_SETTLE_MAX_MS,
+                self.MAX_SCROLL_RETRIES,
+                self.SCROLL_TOTAL_MAX_MS
+            )
+        except WebDriverException as e:
+            self.logger.error(f"Error during scrolling: {e}")
 
     def click_next_button(self) -> bool:
         """Clicks the 'Next' button for pagination"""
@@ -640,122 +1240,72 @@ class Amazon:
     # DATA EXTRACTION METHODS
     # ========================================================================
 
-    def _extract_product_details(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract product details from the product page"""
+    def _extract_product_details(self, page: ProductPage) -> Dict[str, str]:
+        """Extract product details from the product page detail tables"""
         details = {
             "asin": None, "weight": None, "brand": None, "additives": None,
             "net_quantity": None, "allergen_information": None, "ingredients": None,
             "ingredient_type": None, 'generic_name': None
         }
 
-        # Extract from technical details table
-        self._extract_technical_details(soup, details)
-
-        # Extract from additional information section
-        self._extract_additional_information(soup, details)
+        for key, value in page.tech_rows + page.addl_rows:
+            self._process_detail_row(key, value, details)
 
         return details
 
-    def _extract_technical_details(self, soup: BeautifulSoup, details: Dict[str, str]):
-        """Extract technical details from product page"""
-        rows = soup.select('#productDetails_techSpec_section_1 tr')
-        for row in rows:
-            key_el = row.find('th')
-            value_el = row.find('td')
-            if key_el and value_el:
-                key = self._clean_text(key_el.get_text()).lower()
-                value = self._clean_text(value_el.get_text())
-                self._process_detail_row(key, value, details)
-
-    def _extract_additional_information(self, soup: BeautifulSoup, details: Dict[str, str]):
-        """Extract additional information from product page"""
-        additional_info = soup.select('#productDetails_detailBullets_sections1 tr')
-        for row in additional_info:
-            key_el = row.find('th')
-            value_el = row.find('td')
-            if key_el and value_el:
-                key = self._clean_text(key_el.get_text()).lower().strip()
-                value = self._clean_text(value_el.get_text())
-                self._process_detail_row(key, value, details)
-
-    def get_technical_details(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def get_technical_details(self, page: ProductPage) -> Dict[str, str]:
         """Get technical details as dictionary"""
-        details = {}
         try:
-            rows = soup.select('#productDetails_techSpec_section_1 tr')
-            for row in rows:
-                key_el = row.find('th')
-                value_el = row.find('td')
-                if key_el and value_el:
-                    key = self._clean_text(key_el.get_text()).lower()
-                    value = self._clean_text(value_el.get_text())
-                    details[key] = value
-            return details
+            return dict(page.tech_rows)
         except Exception as e:
             self.logger.error(f"Error extracting technical details: {e}")
-            return details
+            return {}
 
-    def get_additional_information(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def get_additional_information(self, page: ProductPage) -> Dict[str, str]:
         """Get additional information as dictionary"""
-        details = {}
         try:
-            additional_info = soup.select('#productDetails_detailBullets_sections1 tr')
-            for row in additional_info:
-                key_el = row.find('th')
-                value_el = row.find('td')
-                if key_el and value_el:
-                    key = self._clean_text(key_el.get_text()).lower()
-                    value = self._clean_text(value_el.get_text())
-                    details[key] = value
-            return details
+            return dict(page.addl_rows)
         except Exception as e:
             self.logger.error(f"Error extracting additional information: {e}")
-            return details
+            return {}
 
     def _process_detail_row(self, key: str, value: str, details: Dict[str, str]):
         """Process individual detail row and map to appropriate fields"""
-        mapping = {
-            "weight": "weight", "item weight": "weight",
-            "brand": "brand", "additives": "additives",
-            "net quantity": "net_quantity", "allergen information": "allergen_information",
-            "ingredient type": "ingredient_type", "ingredients": "ingredients",
-            "asin": "asin", "generic name": "generic_name"
-        }
-
-        if key in mapping:
-            field = mapping[key]
-            if field == "ingredients":
-                self._handle_ingredients_field(value, details)
-            elif not details.get(field):
-                details[field] = value
+        field = DETAIL_FIELD_MAP.get(key)
+        if field is None:
+            return
+        if field == "ingredients":
+            self._handle_ingredients_field(value, details)
+        elif not details[field]:  # details is pre-seeded with every mapped field
+            details[field] = value
 
     def _handle_ingredients_field(self, value: str, details: Dict[str, str]):
         """Handle special case for ingredients field"""
-        allergen_key = "allergen information:"
-        if allergen_key in value.lower():
-            parts = re.split(re.escape(allergen_key), value, flags=re.IGNORECASE)
+        if "allergen information:" in value.lower():
+            parts = ALLERGEN_SPLIT_RE.split(value, maxsplit=1)
             details["ingredients"] = self._clean_text(parts[0])
             details["allergen_information"] = self._clean_text(parts[1]) if len(parts) > 1 else None
         else:
             details["ingredients"] = value
 
-    def _extract_ingredients(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_ingredients(self, page: ProductPage) -> Optional[str]:
         """Extract ingredients from important information section"""
-        sections = soup.select('#important-information .content')
-        for section in sections:
-            heading = section.find('h4')
-            if heading and 'ingredients' in heading.text.lower():
-                text = section.get_text(separator=' ', strip=True)
-                return self._clean_text(text.replace(heading.text, ''))
+        for section in page.xpath('important_info'):
+            heading = section.find('.//h4')
+            if heading is None:
+                continue
+            heading_text = heading.text_content()
+            if 'ingredients' in heading_text.lower():
+                return self._clean_text(_element_text(section).replace(heading_text, ''))
         return None
 
-    def get_breadcrumbs(self, soup: BeautifulSoup) -> List[str]:
+    def get_breadcrumbs(self, page: ProductPage) -> List[str]:
         """Extract breadcrumb navigation"""
         try:
-            breadcrumb_ul = soup.select_one("#wayfinding-breadcrumbs_feature_div ul")
-            if breadcrumb_ul:
-                links = breadcrumb_ul.select("a.a-link-normal.a-color-tertiary")
-                breadcrumbs = [self._clean_text(link.get_text()) for link in links]
+            breadcrumb_ul = page.first('breadcrumb_list')
+            if breadcrumb_ul is not None:
+                links = page.xpath('breadcrumb_links', breadcrumb_ul)
+                breadcrumbs = [self._clean_text(link.text_content()) for link in links]
                 self.logger.info(f"Breadcrumbs extracted: {' > '.join(breadcrumbs)}")
                 return breadcrumbs
             self.logger.warning("Breadcrumb section not found.")
@@ -763,84 +1313,82 @@ class Amazon:
             self.logger.error(f"Error extracting breadcrumbs: {e}")
         return []
 
-    def get_all_product_images(self, soup: BeautifulSoup) -> List[str]:
-        """Extract all product images"""
-        image_urls = set()
+    def get_all_product_images(self, page: ProductPage) -> List[str]:
+        """Extract all product images, deduplicated in page order"""
+        image_urls = []
 
         try:
             # 1. Main image
-            main_img = soup.select_one("#landingImage")
-            if main_img and main_img.has_attr('src'):
-                image_urls.add(main_img['src'])
-
-            # 2. Image thumbnails via data-a-dynamic-image (contains all image URLs as JSON-like string)
-            image_data = soup.select_one("#imgTagWrapperId img")
-            if image_data and image_data.has_attr("data-a-dynamic-image"):
-                dynamic_image_json = image_data["data-a-dynamic-image"]
-                urls = re.findall(r'"(https://[^"]+)"', dynamic_image_json)
-                image_urls.update(urls)
+            main_src = page.first('main_image_src')
+            if main_src:
+                image_urls.append(str(main_src))
+
+            # 2. Image thumbnails via data-a-dynamic-image ({"url": [width, height], ...})
+            image_data = page.first('dynamic_image')
+            dynamic_image_json = image_data.get('data-a-dynamic-image') if image_data is not None else None
+            if dynamic_image_json is not None:
+                if '&quot;' in dynamic_image_json:  # attribute occasionally arrives double-encoded
+                    dynamic_image_json = html.unescape(dynamic_image_json)
+                try:
+                    urls = [u for u in orjson.loads(dynamic_image_json) if u.startswith("https://")]
+                except ValueError:
+                    urls = DYNAMIC_IMAGE_URL_RE.findall(dynamic_image_json)
+                # Prefer the full-size renditions when the attribute lists several sizes
+                image_urls.extend([u for u in urls if HIRES_IMAGE_RE.search(u)] or urls)
 
             # 3. Gallery images from thumbnail container (optional fallback)
-            thumbnails = soup.select("li.image.item img")
-            for thumb in thumbnails:
-                src = thumb.get("src")
+            for src in page.xpath('thumbnail_srcs'):
                 if src:
-                    high_res = re.sub(r"\._.*?_\.", ".", src)
-                    image_urls.add(high_res)
-
-            self.logger.info(f"Found {len(image_urls)} image(s) for second method.")
-            return list(image_urls)
+                    image_urls.append(THUMBNAIL_SIZE_RE.sub(".", src))
 
         except Exception as e:
             self.logger.error(f"Error extracting images: {e}")
-            return []
 
-    def _get_images(self, soup: BeautifulSoup) -> List[str]:
-        """Get product images"""
+        image_urls = list(dict.fromkeys(image_urls))
+        self.logger.info(f"Found {len(image_urls)} image(s) for second method.")
+        return image_urls
+
+    def _get_images(self, page: ProductPage) -> List[str]:
+        """Get product images, deduplicated in page order"""
         image_urls = []
         try:
-            scripts = soup.find_all("script")
-            for script in scripts:
-                if script and "colorImages" in str(script):
-                    json_str = script.string or script.get_text()
-                    if json_str:
-                        json_str = json_str.replace("'", '"')  # Convert to valid JSON format
-                        matches_hd = re.findall(r'"hiRes"\s*:\s*"([^"]+)"', json_str)
-                        image_urls.extend(matches_hd)
-                        matches = re.findall(r'"large"\s*:\s*"([^"]+)"', json_str)
-                        image_urls.extend(matches)
-
-                        if matches:
-                            break
+            for json_str in page.xpath('color_images_script'):
+                json_str = json_str.replace("'", '"')  # Convert to valid JSON format
+                image_urls = list(dict.fromkeys(IMAGE_URL_RE.findall(json_str)))
+                if image_urls:
+                    break
         except Exception as e:
             self.logger.error(f"Error extracting images from JS: {e}")
 
         if not image_urls:
-            image_urls = self.get_all_product_images(soup)
+            image_urls = self.get_all_product_images(page)
 
-        return list(set(image_urls))
+        return image_urls
 
     def get_product_urls(self, url: str) -> List[str]:
         """Scrapes product URLs from category pages"""
-        if not self._safe_get(url):
-            self.logger.error(f"Failed to load product page {url}. Skipping.")
-            return []
+        product_urls, resume_url = self._get_search_urls_http(url)
+        if resume_url is None:
+            return list(product_urls)
+        if product_urls:
+            self.logger.info(f"Continuing in the browser from {resume_url}")
+
+        if not self._safe_get(resume_url):
+            self.logger.error(f"Failed to load product page {resume_url}. Skipping.")
+            return list(product_urls)
 
-        product_urls = set()
         page_count = 1
 
         while True:
             self.logger.info(f"--- Scraping product URLs from page {page_count} ---")
             self._load_all_products()
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            page_urls = self._extract_product_urls_from_page(soup)
+            page_urls = self._extract_product_urls_from_page()
 
             if not page_urls:
                 self.logger.warning(f"No product URLs found on page {page_count}. Check selectors.")
 
             self.logger.info(f"Found {len(page_urls)} new URLs on this page.")
-            product_urls.update(page_urls)
+            product_urls.update(dict.fromkeys(page_urls))
             self.logger.info(f"Total unique URLs collected so far: {len(product_urls)}")
 
             if not self.click_next_button():
@@ -851,83 +1399,162 @@ class Amazon:
         self.logger.info(f"Total unique product URLs collected from all pages: {len(product_urls)}")
         return list(product_urls)
 
-    def _extract_product_urls_from_page(self, soup: BeautifulSoup) -> set:
-        """Extract product URLs from current page"""
-        page_urls = set()
+    def _get_search_urls_http(self, url: str) -> Tuple[Dict[str, None], Optional[str]]:
+        """Walk server-rendered search result pages over HTTP.
 
-        # Multiple selectors for different page layouts
-        selectors = [
-            ('a', lambda x: x and ('ProductGridItem__overlay__IQ3Kw' in x or
-                                  ('a-link-normal' in x and 's-no-outline' in x))),
-            ('a', re.compile(r'ProductShowcase__title__')),
-            ('a.a-link-normal.s-no-outline[href*="/dp/"]', None)
-        ]
+        Returns the URLs collected (an insertion-ordered set) and the first page that needs
+        the browser, or None when every page was read.
+        """
+        product_urls = {}
+        page_url = url
+        page_count = 0
 
-        for selector, class_filter in selectors:
-            if class_filter and callable(class_filter):
-                elements = soup.find_all(selector, class_=class_filter)
-            elif class_filter:
-                elements = soup.find_all(selector, class_=class_filter)
-            else:
-                elements = soup.select(selector)
+        while page_url:
+            page_html = self._fetch_html(page_url, marker=SEARCH_RESULTS_MARKER)
+            if page_html is None:
+                return product_urls, page_url
+            page_count += 1
 
-            for element in elements:
-                href = element.get('href')
-                if href and '/dp/' in href:
-                    clean_href = href.split('/ref=')[0]
-                    full_url = self.BASE_URL + clean_href
-                    page_urls.add(full_url)
+            tree = _make_tree(page_html)
+            for href in _XPATHS['search_result_links'](tree):
+                product_urls[urljoin(page_url, href).partition('/ref=')[0]] = None
+            self.logger.info(f"HTTP page {page_count}: {len(product_urls)} unique URLs so far")
 
-        # Handle special elements found via Selenium
+            next_href = _XPATHS['search_next_page'](tree)
+            page_url = urljoin(page_url, next_href[0]) if next_href else None
+            if page_url:
+                self._limiter.acquire()
+
+        self.logger.info(f"Collected {len(product_urls)} product URLs from {page_count} page(s) over HTTP")
+        return product_urls, None
+
+    def _extract_product_urls_from_page(self) -> List[str]:
+        """Collect unique product URLs, in page order, in a single browser round trip"""
         try:
-            links = self.driver.find_elements(By.XPATH, '//div[@data-testid="small-editorial-tile"]//a')
-            for link in links:
-                href = link.get_attribute("href")
-                if href and '/dp/' in href:
-                    page_urls.add(href)
-        except:
-            pass
+            return self.driver.execute_script(PRODUCT_LINK_SCRIPT, PRODUCT_LINK_SELECTOR) or []
+        except WebDriverException as e:
+            self.logger.error(f"Error extracting product URLs: {e}")
+            return []
+
+    def _sync_page_session(self):
+        """Copy the browser's cookies and user agent onto the HTTP page session"""
+        try:
+            for cookie in self.driver.get_cookies():
+                self.page_session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain'), path=cookie.get('path', '/')
+                )
+            self.page_session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        except WebDriverException as e:
+            self.logger.warning(f"Could not copy browser session for HTTP fetches: {e}")
+
+    def _fetch_html(self, url: str, marker: str = PRODUCT_PAGE_MARKER) -> Optional[str]:
+        """Fetch a server-rendered page over plain HTTP; None means the browser must load it"""
+        if not self.page_session.cookies:  # no warmed-up browser session to borrow yet
+            return None
+        try:
+            response = self.page_session.get(url, timeout=self.HTTP_FETCH_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+        text = response.text
+        if response.status_code != 200 or CAPTCHA_PAGE_MARKER in text or marker not in text:
+            self.logger.debug(f"HTTP fetch unusable for {url} (status {response.status_code}); using browser")
+            return None
+        return text
+
+    def _render_product_page(self, url: str) -> Optional[str]:
+        """Load a product page in the browser and return its HTML once the details are in"""
+        if not self._safe_get(url):
+            return None
+        return self._loaded_product_html(url)
 
-        return page_urls
+    def _loaded_product_html(self, url: str) -> Optional[str]:
+        """HTML of the product page already open in the browser, once the details are in"""
+        has_title, _ = self._wait_for_selectors('#productTitle', PRODUCT_READY_SELECTOR)
+        if not has_title:
+            self.logger.warning(f"Product page {url} did not render a title")
+            return None
+        try:
+            return self.driver.page_source
+        except WebDriverException as e:
+            self.logger.warning(f"Could not read product page {url}: {e}")
+            return None
 
     def get_product_details(self, url: str) -> Dict[str, Any]:
         """Extract detailed product information from a single product page"""
-        if not self._safe_get(url):
+        cached = self._cached_details(url)
+        if cached is not None:
+            return cached
+        return self._details_from_html(url, self._fetch_html(url))
+
+    def _details_from_html(self, url: str, page_html: Optional[str]) -> Dict[str, Any]:
+        """Parse already-fetched HTML, rendering the page on this thread's driver when there is none"""
+        if page_html is None:
+            page_html = self._render_product_page(url)
+        details = self._parse_product_page(url, page_html)
+        self._remember_details(url, details)
+        return details
+
+    def _prefetch_html(self, url: str) -> Optional[str]:
+        """Rate-limited HTTP fetch for a worker thread; None if cached or the browser is needed"""
+        if self._cached_details(url) is not None:
+            return None
+        self._limiter.acquire()
+        return self._fetch_html(url)
+
+    @staticmethod
+    def _product_key(url: str) -> str:
+        """ASIN of a product URL, or the URL itself when it has none"""
+        match = ASIN_RE.search(url)
+        return match.group(1) if match else url
+
+    def _cached_details(self, url: str) -> Optional[Dict[str, Any]]:
+        """Copy of the product already parsed for this URL's ASIN, if any"""
+        match = ASIN_RE.search(url)
+        if not match:
+            return None
+        with self._details_cache_lock:
+            cached = self._details_cache.get(match.group(1))
+        return dict(cached) if cached is not None else None
+
+    def _remember_details(self, url: str, details: Dict[str, Any]):
+        """Keep a successfully parsed product for later URLs with the same ASIN"""
+        match = ASIN_RE.search(url)
+        if not match or not details:
+            return
+        with self._details_cache_lock:
+            self._details_cache[match.group(1)] = details
+            if len(self._details_cache) > self.DETAILS_CACHE_SIZE:
+                del self._details_cache[next(iter(self._details_cache))]
+
+    def _parse_product_page(self, url: str, page_html: Optional[str]) -> Dict[str, Any]:
+        """Parse fetched or rendered product page HTML into a product record"""
+        if page_html is None:
             self.logger.error(f"Failed to load product page {url}. Skipping.")
             return {}
 
         try:
-            parsed_url = urlparse(url)
-            base_url = urlunparse(parsed_url._replace(query=""))
+            base_url = url.partition('?')[0]
+            page = ProductPage(_strip_irrelevant_html(page_html))
 
-            WebDriverWait(self.driver, self.PAGE_LOAD_TIMEOUT).until(
-                EC.presence_of_element_located((By.ID, "productTitle"))
-            )
-            time.sleep(self.SCROLL_PAUSE_TIME + random.randint(3, 6))
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            return self._parse_product_data(soup, base_url)
+            return self._parse_product_data(page, base_url)
 
         except Exception as e:
             self.logger.error(f"CRITICAL: Failed to process product page {url}. Error: {e}", exc_info=True)
             return {}
 
-    def _parse_product_data(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
-        """Parse product data from soup"""
-        details = self._extract_product_details(soup)
-        ingredients = self._extract_ingredients(soup) or details.get('ingredients')
-        images = self._get_images(soup)
-        def safe_find_text(soup, selector):
-            try:
-                return self._clean_text(soup.select_one(selector).text)
-            except AttributeError:
-                return None
-
-        mrp = safe_find_text(soup, 'span.a-price.a-text-price span.a-offscreen')
+    def _parse_product_data(self, page: ProductPage, base_url: str) -> Dict[str, Any]:
+        """Parse product data from a parsed product page"""
+        details = self._extract_product_details(page)
+        ingredients = self._extract_ingredients(page) or details.get('ingredients')
+        images = self._get_images(page)
+        mrp = self._xpath_text(page, 'mrp')
 
         product = {
             "variant_id": None,
-            "name": safe_find_text(soup, '#productTitle'),
+            "name": self._xpath_text(page, 'title'),
             "product_url": base_url,
             "brand_name": details.get('brand'),
             "category": None,
@@ -942,15 +1569,15 @@ class Amazon:
             "nutrients_main_ocr": None,
             "images": self.extract_image_urls_text(images),
             "other_images": None,
-            "breadcrumbs": json.dumps({"category": self.get_breadcrumbs(soup)}),
+            "breadcrumbs": orjson.dumps({"category": self.get_breadcrumbs(page)}).decode(),
             "front_img": None,
             "back_img": None,
             "nutrients_img": None,
             "ingredients_img": None,
             "source": "Amazon",
             "status": "raw",
-            "addtional_detail": json.dumps(self.get_technical_details(soup)),
-            "addtional_info": json.dumps(self.get_additional_information(soup))
+            "addtional_detail": orjson.dumps(self.get_technical_details(page)).decode(),
+            "addtional_info": orjson.dumps(self.get_additional_information(page)).decode()
         }
         return product
 
@@ -961,9 +1588,10 @@ class Amazon:
     def _send_to_api(self, product_data: Dict[str, Any]) -> bool:
         """Send product data to API endpoint"""
         try:
-            response = requests.post(
+            response = self.api_session.post(
                 self.API_ENDPOINT,
-                json=product_data,
+                data=orjson.dumps(product_data),
+                headers={'Content-Type': 'application/json'},
                 timeout=self.REQUEST_TIMEOUT
             )
             if response.status_code == 200:
@@ -977,6 +1605,130 @@ class Amazon:
             self.logger.error(f"Network Error: Could not connect to API endpoint. Error: {e}")
             return False
 
+    def _queue_insert(self, product_data: Dict[str, Any]):
+        """Hand a product to the insert thread; it is sent with a later batch, whose outcome
+        shows up in _inserted_count / _insert_error_count"""
+        self._insert_queue.put(product_data)
+
+    def _insert_worker(self):
+        """Buffer queued products and flush on a full batch, on a drain request, or once the
+        oldest buffered product has waited INSERT_MAX_WAIT seconds.
+
+        Runs on the insert thread, which owns the pending buffer.
+        """
+        oldest = None
+        while True:
+            timeout = None
+            if oldest is not None:
+                deadline = max(oldest + self.INSERT_MAX_WAIT, self._retry_after)
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._insert_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            try:
+                if isinstance(item, dict):
+                    if not self._pending:
+                        oldest = time.monotonic()
+                    self._pending.append(item)
+                    # A full batch waits too while a held batch's retry is not yet due
+                    if len(self._pending) < self._insert_batch_size or time.monotonic() < self._retry_after:
+                        continue
+                    self._last_insert_ok = self._flush_inserts()
+                elif isinstance(item, Future):
+                    ok = True
+                    # Batches kept for retry are dropped once INSERT_MAX_RETRIES run out
+                    while self._pending:
+                        time.sleep(max(0.0, self._retry_after - time.monotonic()))
+                        ok = self._last_insert_ok = self._flush_inserts()
+                    item.set_result(ok)
+                else:
+                    self._last_insert_ok = self._flush_inserts()
+            except Exception as e:
+                self.logger.error(f"Unexpected error while inserting products: {e}", exc_info=True)
+                self._last_insert_ok = False
+                if isinstance(item, Future) and not item.done():
+                    item.set_result(False)
+            oldest = time.monotonic() if self._pending else None
+
+    def _drain_inserts(self) -> bool:
+        """Flush whatever is still buffered and wait for the insert thread to finish"""
+        done = Future()
+        self._insert_queue.put(done)
+        try:
+            return done.result()
+        except Exception as e:
+            self.logger.error(f"Failed to flush pending inserts: {e}", exc_info=True)
+            return False
+
+    def _flush_inserts(self) -> bool:
+        """Send all buffered products, halving the batch size whenever the API answers 413"""
+        success = True
+        while self._pending:
+            batch = self._pending[:self._insert_batch_size]
+            status = self._post_batch(batch)
+
+            if status == 413 and self._insert_batch_size > 1:
+                self._insert_batch_size = max(1, self._insert_batch_size // 2)
+                self.logger.warning(f"Bulk insert too large, retrying with batches of {self._insert_batch_size}")
+                continue
+
+            if status is None and self._insert_retries < self.INSERT_MAX_RETRIES:
+                # Keep the batch buffered; the insert thread retries it after INSERT_MAX_WAIT
+                self._insert_retries += 1
+                self._retry_after = time.monotonic() + self.INSERT_MAX_WAIT
+                self.logger.warning(f"Keeping {len(self._pending)} products for retry "
+                                    f"({self._insert_retries}/{self.INSERT_MAX_RETRIES})")
+                return False
+
+            self._insert_retries = 0
+            if status != 200:
+                success = False
+            if self._bulk_insert_supported:  # single-insert fallbacks count themselves
+                if status == 200:
+                    self._inserted_count += len(batch)
+                else:
+                    self._insert_error_count += len(batch)
+            if status != 200 and self._bulk_insert_supported:
+                self.logger.error(f"Dropped {len(batch)} products: "
+                                  f"{', '.join(str(item.get('product_url')) for item in batch)}")
+            del self._pending[:len(batch)]
+        return success
+
+    def _post_batch(self, batch: List[Dict[str, Any]]) -> Optional[int]:
+        """POST a batch to the bulk endpoint, falling back to single inserts if it is unavailable"""
+        if self._bulk_insert_supported:
+            try:
+                response = self.api_session.post(
+                    self.BULK_INSERT_URL,
+                    data=orjson.dumps({"items": batch}),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=self.REQUEST_TIMEOUT
+                )
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Network Error: Could not connect to bulk API endpoint. Error: {e}")
+                return None
+
+            if response.status_code in (404, 405):
+                self.logger.warning("Bulk insert endpoint unavailable, falling back to single inserts.")
+                self._bulk_insert_supported = False
+            else:
+                if response.status_code == 200:
+                    self.logger.info(f"Successfully inserted batch of {len(batch)} products.")
+                elif response.status_code != 413:
+                    self.logger.error(f"Bulk API Error: Status {response.status_code}, Response: {response.text}")
+                return response.status_code
+
+        # Single inserts are not retried, since part of the batch may already be stored
+        failed = [product_data for product_data in batch if not self._send_to_api(product_data)]
+        self._inserted_count += len(batch) - len(failed)
+        self._insert_error_count += len(failed)
+        if failed:
+            self.logger.error(f"Single inserts failed for: {', '.join(str(item.get('product_url')) for item in failed)}")
+            return 500
+        return 200
+
     # ========================================================================
     # MAIN SCRAPING METHODS
     # ========================================================================
@@ -1006,58 +1758,133 @@ class Amazon:
         except Exception as e:
             self.logger.critical(f"A critical error occurred: {e}", exc_info=True)
         finally:
+            self._drain_inserts()
             self._cleanup()
 
+    @contextmanager
+    def driver_session(self):
+        """Run the with-block on this thread's long-lived driver, starting it on first use.
+
+        The driver is kept for later calls and quit by _cleanup or at interpreter exit.
+        """
+        if self.driver is None and not self.init_driver():
+            raise WebDriverException("WebDriver could not be started")
+        yield self.driver
+
     def scrape_product(self, product_url: str) -> None:
         """Main method to scrape a single Amazon product"""
-        if not self.init_driver():
+        self.scrape_products([product_url])
+
+    def scrape_products(self, product_urls: List[str]) -> None:
+        """Scrape several products on one browser, warming up only once"""
+        if not product_urls:
             return
 
         try:
-            if not self._perform_warmup_and_get(product_url):
-                self.logger.error("Scraping aborted due to navigation failure.")
-                return
-
-            product_data = self.get_product_details(product_url)
-            if product_data:
-                self.logger.info(f"Scraped data: {product_data}")
-                self._send_to_api(product_data)
-            else:
-                self.logger.error(f"Failed to scrape any details for product: {product_url}")
+            with self.driver_session():
+                if not self._perform_warmup_and_get(product_urls[0]):
+                    self.logger.error("Scraping aborted due to navigation failure.")
+                    return
+
+                # The warm-up already opened the first product, so reuse its HTML
+                first_html = self._loaded_product_html(product_urls[0])
+                unique_urls = {}
+                for url in product_urls:
+                    unique_urls.setdefault(self._product_key(url), url)
+                unique_urls = list(unique_urls.values())
+                if len(unique_urls) < len(product_urls):
+                    self.logger.info(f"Skipping {len(product_urls) - len(unique_urls)} duplicate product URLs")
+
+                # Fetch the rest over HTTP in parallel; browser fallbacks stay on this thread's driver
+                with ThreadPoolExecutor(max_workers=self.HTTP_WORKERS) as executor:
+                    prefetched = itertools.chain([first_html], executor.map(self._prefetch_html, unique_urls[1:]))
+                    for product_url, page_html in zip(unique_urls, prefetched):
+                        product_data = self._cached_details(product_url) or self._details_from_html(product_url, page_html)
+                        if product_data:
+                            self.logger.info(f"Scraped data: {product_data}")
+                            self._send_to_api(product_data)
+                        else:
+                            self.logger.error(f"Failed to scrape any details for product: {product_url}")
 
-            self.logger.info("Single product scraping finished.")
+            self.logger.info("Product scraping finished.")
 
         except KeyboardInterrupt:
             self.logger.info("\nScraping stopped by user.")
         except Exception as e:
             self.logger.critical(f"A critical error occurred: {e}", exc_info=True)
-        finally:
-            self._cleanup()
 
     def _process_product_urls(self, product_urls: List[str]):
-        """Process list of product URLs with progress tracking"""
-        with tqdm(total=len(product_urls), desc="Amazon Category Scraping", unit="products") as pbar:
-            for url in product_urls:
-                product_data = self.get_product_details(url)
+        """Process list of product URLs in parallel with progress tracking"""
+        self.browser_pool = BrowserPool(
+            self._create_warm_driver, self.POOL_SIZE, self.MAX_USES_PER_INSTANCE, self.logger
+        )
+
+        progress = tqdm(
+            total=len(product_urls), desc="Amazon Category Scraping", unit="products",
+            mininterval=1.0, smoothing=0, miniters=max(1, len(product_urls) // 200),
+            disable=not sys.stderr.isatty()
+        )
+        last_status = None
+        scrape_failed = 0
+
+        with ThreadPoolExecutor(max_workers=self.HTTP_WORKERS) as executor, progress as pbar:
+            futures = {executor.submit(self._scrape_one, url): url for url in product_urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    _, product_data = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error scraping product {url}: {e}")
+                    product_data = None
+
                 if product_data:
-                    if self._send_to_api(product_data):
-                        pbar.set_postfix({"Status": "Success"})
-                    else:
-                        pbar.set_postfix({"Status": "API Error"})
+                    self._queue_insert(product_data)
                 else:
                     self.logger.warning(f"Failed to scrape details for product: {url}")
-                    pbar.set_postfix({"Status": "Scrape Failed"})
-
+                    scrape_failed += 1
+
+                # Insert outcomes arrive per batch, so report running totals, not per product
+                status = (self._inserted_count, self._insert_error_count, scrape_failed)
+                if status != last_status:
+                    pbar.set_postfix_str(
+                        f"Inserted={status[0]}, API Errors={status[1]}, Scrape Failed={status[2]}", refresh=False)
+                    last_status = status
                 pbar.update(1)
-                time.sleep(random.uniform(2, 5))
 
         self.logger.info("Scraping finished.")
 
+    def _scrape_one(self, url: str):
+        """Scrape a single product over HTTP, borrowing a pooled driver only when the page needs a browser"""
+        cached = self._cached_details(url)
+        if cached is not None:
+            return url, cached
+
+        self._limiter.acquire()
+        page_html = self._fetch_html(url)
+        if page_html is None:
+            with self.browser_pool.checkout() as driver:
+                self.driver = driver
+                try:
+                    page_html = self._render_product_page(url)
+                finally:
+                    self.driver = None
+        details = self._parse_product_page(url, page_html)
+        self._remember_details(url, details)
+        return url, details
+
     def _cleanup(self):
         """Clean up resources"""
+        atexit.unregister(self._cleanup)
+        if self.browser_pool:
+            self.browser_pool.close()
+            self.browser_pool = None
+            self.logger.info("Browser pool closed.")
         if self.driver:
             self.driver.quit()
+            self.driver = None
             self.logger.info("WebDriver closed.")
+        self.api_session.close()
+        self.page_session.close()
 
 
 # ============================================================================
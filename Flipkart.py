@@ -121,6 +121,11 @@ class Flipkart:
       return ""
     return re.sub(r'[\u200e\u200f]', '', text).strip()
   
+  def _select_text(self, soup: BeautifulSoup, selector: str) -> Optional[str]:
+    """Return cleaned text of the first element matching selector, or None"""
+    element = soup.select_one(selector)
+    return self._clean_text(element.get_text()) if element else None
+  
   def _extract_product_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
     """Extract product details from the product page"""
     general_data = {}
@@ -333,15 +338,10 @@ class Flipkart:
         soup = BeautifulSoup(self.driver.page_source, 'html.parser')
         details = self._extract_product_details(soup)
         images = self._get_images(soup)
-        def safe_find(by, value):
-          try:
-            return self._clean_text(self.driver.find_element(by, value).text)
-          except:
-            return None
         
         product = {
           "variant_id": None,
-          "name": safe_find(By.CLASS_NAME, 'VU-ZEz'),
+          "name": self._select_text(soup, '.VU-ZEz'),
           "product_url": url,
           "brand_name": details.get('brand'),
           "category": None,
@@ -350,7 +350,7 @@ class Flipkart:
           "allergen_information": details.get('allergen_information'),
           "mass_measurement_unit": self.get_mass_measurement_unit(details.get('net quantity')) or self.get_mass_measurement_unit(details.get('quantity')),
           "net_weight": details.get('net quantity') or details.get('quantity'),
-          "mrp": safe_find(By.CLASS_NAME, 'Nx9bqj CxhGGd') or safe_find(By.CLASS_NAME, 'Nx9bqj'),
+          "mrp": self._select_text(soup, '.Nx9bqj.CxhGGd') or self._select_text(soup, '.Nx9bqj'),
           "ingredients_main_ocr": None,
           "nutrients_main_ocr": None,
           "images": self.extract_image_urls_text(images),
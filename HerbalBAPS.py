@@ -12,6 +12,7 @@ import csv
 import time
 import json
 import random
+from functools import partial
 from distutils.command.clean import clean
 
 import requests
@@ -30,6 +31,8 @@ from selenium.common.exceptions import (
 from seleniumwire import webdriver
 from tqdm import tqdm
 
+ALLERGEN_SPLIT_RE = re.compile(r'Allergen Information:', re.IGNORECASE)
+
 
 class HerbalBAPS:
   def __init__(self, headless: bool = True):
@@ -67,6 +70,20 @@ class HerbalBAPS:
     self.MAX_RETRIES = 3
     self.PAGE_LOAD_TIMEOUT = 20
     self.REQUEST_TIMEOUT = 30
+    
+    # Detail-table key -> handler(value, details)
+    self._DETAIL_HANDLERS = {
+      "weight": self._set_weight,
+      "item weight": self._set_weight,
+      "brand": partial(self._set_detail, "brand"),
+      "additives": partial(self._set_detail, "additives"),
+      "net quantity": partial(self._set_detail, "net_quantity"),
+      "allergen information": partial(self._set_detail, "allergen_information"),
+      "ingredient type": partial(self._set_detail, "ingredient_type"),
+      "ingredients": self._set_ingredients,
+      "asin": partial(self._set_detail, "asin"),
+      "generic name": partial(self._set_detail, "generic_name"),
+    }
   
   def _setup_logging(self):
     """Configure logging settings"""
@@ -195,35 +212,29 @@ class HerbalBAPS:
   
   def _process_detail_row(self, key: str, value: str, details: Dict[str, str]):
     """Process a single detail row and update the details dictionary"""
-    if key == "weight" and not details["weight"]:
-      details["weight"] = value
-    elif key == "brand":
-      details["brand"] = value
-    elif key == "additives":
-      details["additives"] = value
-    elif key == "net quantity":
-      details["net_quantity"] = value
-    elif key == "allergen information":
-      details["allergen_information"] = value
-    elif key == "ingredient type":
-      details["ingredient_type"] = value
-    elif key == "ingredients":
-      if "Allergen Information:" in value:
-        parts = value.split("Allergen Information:")
-        details["ingredients"] = self._clean_text(parts[0])
-        details["allergen_information"] = self._clean_text(parts[1])
-      elif "Allergen information:" in value:
-        parts = value.split("Allergen information:")
-        details["ingredients"] = self._clean_text(parts[0])
-        details["allergen_information"] = self._clean_text(parts[1])
-      else:
-        details["ingredients"] = value
-    elif key == "asin":
-      details["asin"] = value
-    elif key == "item weight" and not details["weight"]:
+    handler = self._DETAIL_HANDLERS.get(key)
+    if handler:
+      handler(value, details)
+  
+  @staticmethod
+  def _set_detail(field: str, value: str, details: Dict[str, str]):
+    """Store a detail value under the given field"""
+    details[field] = value
+  
+  @staticmethod
+  def _set_weight(value: str, details: Dict[str, str]):
+    """Store the weight unless an earlier row already provided it"""
+    if not details["weight"]:
       details["weight"] = value
-    elif key == "generic name":
-      details["generic_name"] = value
+  
+  def _set_ingredients(self, value: str, details: Dict[str, str]):
+    """Store ingredients, splitting off any trailing allergen information"""
+    parts = ALLERGEN_SPLIT_RE.split(value, maxsplit=1)
+    if len(parts) > 1:
+      details["ingredients"] = self._clean_text(parts[0])
+      details["allergen_information"] = self._clean_text(parts[1])
+    else:
+      details["ingredients"] = value
   
   def _extract_ingredients(self, soup: BeautifulSoup) -> Optional[str]:
     """Extract ingredients from product page"""
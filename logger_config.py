@@ -7,7 +7,7 @@ def setup_logger(name, filename):
     logger.setLevel(logging.DEBUG)
     os.makedirs('logs', exist_ok=True)
     if not logger.handlers:  # Avoid duplicate handlers
-        handler = logging.FileHandler(f"logs/{filename}", mode="a")
+        handler = logging.FileHandler(f"logs/{filename}", mode="a", encoding="utf-8")
         formatter = logging.Formatter('%(asctime)s --|-- %(name)s --|-- %(levelname)s --|--  %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
@@ -7,19 +7,22 @@ This script scrapes product data from ZeptoNow website including:
 """
 
 import time
-import json
+import orjson
 import re
 import csv
 import os
 import random
-import gzip
+import zlib
 import logging
-import io
-from typing import Any, Dict, List, Optional
+import queue
+import base64
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tqdm import tqdm
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
@@ -28,7 +31,7 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException
 )
-from seleniumwire import webdriver
+from selenium import webdriver
 
 # Configure logging
 os.makedirs('logs', exist_ok=True)
@@ -54,6 +57,48 @@ SCROLL_PAUSE_TIME = 4
 MAX_RETRIES = 3
 PAGE_LOAD_TIMEOUT = 20
 REQUEST_TIMEOUT = 30
+JITTER_RANGE = (0.2, 0.5)
+POOL_SIZE = 3
+CSV_BATCH_SIZE = 25
+
+# Precompiled patterns used on every product
+SLUG_RE = re.compile(r'[^\w-]+')
+VARIANT_ID_RE = re.compile(r'pvid/([a-f0-9-]+)')
+IMAGE_TRANSFORM_RE = re.compile(r'/tr:[^/]+')
+PRODUCT_HEADER_RE = re.compile(r'relative\s+flex\s+w-full')
+PRICE_CLASS_RE = re.compile(r'text-[^/]\s+font-medium')
+PRODUCT_GRID_RE = re.compile(
+    r'no-scrollbar grid grid-cols-2 content-start gap-y-4 gap-x-2 px-2.5 py-4 '
+    r'md:grid-cols-3 md:gap-x-3 md:p-3 lg:grid-cols-5 xl:grid-cols-6'
+)
+
+# Counts DOM mutations in the page so the scroll loop reads one number instead of polling layout
+MUTATION_OBSERVER_SCRIPT = """
+window.__zeptoMutations = 0;
+if (!window.__zeptoObserver) {
+    window.__zeptoObserver = new MutationObserver(() => { window.__zeptoMutations++; });
+    window.__zeptoObserver.observe(document.body, {childList: true, subtree: true});
+}
+"""
+MUTATION_PENDING_SCRIPT = "return (window.__zeptoMutations || 0) > 0;"
+SCROLL_STATE_SCRIPT = """
+const state = [window.__zeptoMutations || 0, document.body.scrollHeight];
+window.__zeptoMutations = 0;
+return state;
+"""
+
+# Product page lookups done with CSS instead of full-tree class comparisons. The
+# [class="..."] form matches the whole class attribute, like find(class_="...") did,
+# rather than any element that merely carries these utility classes
+DETAIL_SECTION_SELECTORS = ('div#productHighlights', 'div#productInformationL4')
+DETAIL_ROW_SELECTOR = 'div[class="flex items-start gap-3"]'
+IMAGE_CONTAINER_SELECTOR = 'div[class="no-scrollbar relative flex max-h-full flex-col gap-4 overflow-y-scroll"]'
+PRODUCT_IMAGE_SELECTOR = 'img[src]:not([src=""])'
+
+# Everything read from a product page sits inside a div, so <head> and body-level
+# scripts such as __NEXT_DATA__ are never built into the tree
+PRODUCT_PAGE_STRAINER = SoupStrainer('div')
+PRODUCT_GRID_STRAINER = SoupStrainer('div', class_=PRODUCT_GRID_RE)
 
 
 def get_random_user_agent() -> str:
@@ -61,23 +106,36 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
-def init_driver() -> webdriver.Chrome:
-    """Initialize and return a Chrome WebDriver with configured options."""
+def init_driver(capture_network: bool = False) -> webdriver.Chrome:
+    """Initialize and return a Chrome WebDriver with configured options.
+
+    capture_network turns on the performance log that capture_ajax_data reads; Chrome
+    buffers every Network event until it is read, so pooled page drivers leave it off.
+    """
     options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
+    options.add_argument('--headless=new')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument(f'user-agent={get_random_user_agent()}')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--window-size=1920,1080')
-
-    wire_options = {
-        'connection_timeout': REQUEST_TIMEOUT,
-        'verify_ssl': False,
-        'suppress_connection_errors': False
-    }
-
-    driver = webdriver.Chrome(options=options, seleniumwire_options=wire_options)
+    # Image URLs are read from the DOM and API, so skip downloading pixels and fonts
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+        'profile.managed_default_content_settings.media_stream': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    # 100 MB cache: the Next.js bundles are the same on every product page
+    options.add_argument('--disk-cache-size=104857600')
+    # safe_get waits for the product grid / details itself
+    options.page_load_strategy = 'eager'
+    if capture_network:
+        # Network events are read from the performance log to capture API responses
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     return driver
 
@@ -107,20 +165,51 @@ def safe_get(driver: webdriver.Chrome, url: str) -> bool:
 
 
 def decompress_gzip_response(response_body: bytes) -> Optional[str]:
-    """Decompress gzip-encoded response body."""
+    """Decompress a gzip, zlib or raw deflate response body."""
     try:
-        with gzip.GzipFile(fileobj=io.BytesIO(response_body)) as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        logger.error(f"Decompression error: {e}")
+        # 32 + MAX_WBITS auto-detects a gzip or zlib header
+        data = zlib.decompress(response_body, wbits=32 + zlib.MAX_WBITS)
+    except zlib.error:
+        try:
+            data = zlib.decompress(response_body, wbits=-zlib.MAX_WBITS)
+        except zlib.error as e:
+            logger.error(f"Decompression error: {e}")
+            return None
+    return data.decode('utf-8', errors='ignore')
+
+
+def read_response_body(driver: webdriver.Chrome, request_id: str) -> Optional[str]:
+    """Fetch a finished network response body through the DevTools protocol."""
+    try:
+        result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+    except WebDriverException as e:
+        logger.error(f"Could not read response body: {e}")
         return None
 
+    if not result.get('base64Encoded'):
+        return result.get('body')
+    body = base64.b64decode(result.get('body', ''))
+    is_gzip = body[:2] == b'\x1f\x8b'
+    # A zlib header is 0x78 followed by a byte making the pair a multiple of 31
+    is_zlib = len(body) > 1 and body[0] == 0x78 and ((body[0] << 8) | body[1]) % 31 == 0
+    if is_gzip or is_zlib:
+        text = decompress_gzip_response(body)
+        if text is not None:
+            return text
+    return body.decode('utf-8', errors='ignore')
+
+
+@lru_cache(maxsize=4096)
+def _trim_price(price_text: str) -> str:
+    return price_text[:-2] if len(price_text) > 2 else price_text
+
 
 def safe_price_format(price: Any) -> str:
     """Format price by removing last 2 digits if possible."""
     try:
-        if price and len(str(price)) > 2:
-            return str(price)[:-2]
+        if price:
+            # Cache on the string form; the raw value may be unhashable
+            return _trim_price(str(price))
         return str(price)
     except Exception:
         return str(price)
@@ -129,7 +218,7 @@ def safe_price_format(price: Any) -> str:
 def extract_product_data(json_text: str) -> List[Dict[str, Any]]:
     """Extract product data from JSON API response."""
     try:
-        data = json.loads(json_text)
+        data = orjson.loads(json_text)
         products = []
 
         for item in data.get('storeProducts', []):
@@ -179,50 +268,86 @@ def generate_product_url(name: str, product_id: str) -> str:
     """Generate product URL from product name and ID."""
     if not product_id:
         return ''
-    product_name = re.sub(r'[^\w-]+', '-', name).strip('-').lower()
+    product_name = SLUG_RE.sub('-', name).strip('-').lower()
     return f"{BASE_URL}/pn/{product_name}/pvid/{product_id}"
 
 
+def wait_for_mutations(driver: webdriver.Chrome) -> bool:
+    """Wait until the page observer records a DOM change, giving up after SCROLL_PAUSE_TIME + 2 seconds."""
+    try:
+        WebDriverWait(driver, SCROLL_PAUSE_TIME + 2).until(
+            lambda d: d.execute_script(MUTATION_PENDING_SCRIPT))
+        return True
+    except TimeoutException:
+        return False
+    finally:
+        time.sleep(random.uniform(*JITTER_RANGE))
+
+
+def process_network_log(driver: webdriver.Chrome, filename: str, handled_urls: set, pending: Dict[str, tuple]) -> None:
+    """Save products from API responses that finished loading since the last read of the performance log."""
+    for entry in driver.get_log('performance'):
+        raw = entry['message']
+        if 'Network.responseReceived' not in raw and 'Network.loadingFinished' not in raw:
+            continue
+        message = orjson.loads(raw)['message']
+        params = message.get('params', {})
+
+        if message['method'] == 'Network.responseReceived':
+            response = params.get('response', {})
+            url = response.get('url', '')
+            if 'api.zeptonow.com/api/' in url and url not in handled_urls:
+                handled_urls.add(url)
+                pending[params['requestId']] = (url, response.get('status'))
+            continue
+
+        if message['method'] != 'Network.loadingFinished' or params.get('requestId') not in pending:
+            continue
+
+        url, status = pending.pop(params['requestId'])
+        logger.info(f"Processing API request: {url}")
+
+        try:
+            content = read_response_body(driver, params['requestId'])
+
+            if content and status == 200:
+                products = extract_product_data(content)
+                if products:
+                    save_to_csv(products, filename)
+                    logger.info(f"Added {len(products)} products from API")
+                    print(f"Added {len(products)} products from API")
+        except Exception as e:
+            logger.error(f"Error processing API response: {e}")
+
+
 def capture_ajax_data(driver: webdriver.Chrome, filename: str) -> None:
     """Capture and process AJAX API responses during scrolling."""
     handled_urls = set()
+    driver.execute_script(MUTATION_OBSERVER_SCRIPT)
     last_height = driver.execute_script("return document.body.scrollHeight")
     footer_height = driver.execute_script("""
                 const footer = document.querySelector('footer');
                 return footer ? footer.offsetHeight : 0;
                 """)
     same_count = 0
+    pending = {}
     print(f"Processing API requesting....")
     while same_count < MAX_SCROLL_RETRIES:
         driver.execute_script(f"window.scrollTo(0, {last_height - footer_height - random.randint(480, 600)});")
-        time.sleep(SCROLL_PAUSE_TIME + random.randint(2,3))
-
-        for request in driver.requests:
-            if (request.response and
-                'api.zeptonow.com/api/' in request.url and
-                request.url not in handled_urls):
-
-                handled_urls.add(request.url)
-                logger.info(f"Processing API request: {request.url}")
-
-                try:
-                    content = (decompress_gzip_response(request.response.body)
-                               if request.response.headers.get('Content-Encoding') == 'gzip'
-                               else request.response.body.decode('utf-8'))
-
-                    if content and request.response.status_code == 200:
-                        products = extract_product_data(content)
-                        if products:
-                            save_to_csv(products, filename)
-                            logger.info(f"Added {len(products)} products from API")
-                            print(f"Added {len(products)} products from API")
-                except Exception as e:
-                    logger.error(f"Error processing API response: {e}")
-
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        same_count = same_count + 1 if new_height == last_height else 0
+        wait_for_mutations(driver)
+        process_network_log(driver, filename, handled_urls, pending)
+
+        mutations, new_height = driver.execute_script(SCROLL_STATE_SCRIPT)
+        same_count = same_count + 1 if not mutations or new_height == last_height else 0
         last_height = new_height
 
+    # Responses from the last scroll may finish after the final read
+    if pending:
+        time.sleep(SCROLL_PAUSE_TIME)
+        process_network_log(driver, filename, handled_urls, pending)
+    for url, _ in pending.values():
+        logger.warning(f"API response never finished loading: {url}")
+
 
 def convert_to_dict(data: Dict[str, Any]) -> Dict[str, Optional[Any]]:
     """Convert scraped data to clean snake_case dictionary."""
@@ -258,17 +383,24 @@ def convert_to_dict(data: Dict[str, Any]) -> Dict[str, Optional[Any]]:
         return {}
 
 
+def tag_text(tag) -> str:
+    """Stripped text of a tag, reading a lone text child directly instead of walking descendants."""
+    string = tag.string
+    return string.strip() if string is not None else tag.get_text(strip=True)
+
+
 def scrape_product_page(driver: webdriver.Chrome, url: str) -> Dict[str, Any]:
     """Scrape data from individual product page with retry logic."""
     for attempt in range(MAX_RETRIES):
         try:
             if not safe_get(driver, url):
                 continue
-            time.sleep(SCROLL_PAUSE_TIME + random.random())
+            time.sleep(random.uniform(*JITTER_RANGE))
 
-            variant_id = re.search(r'pvid/([a-f0-9-]+)', url).group(1) if re.search(r'pvid/([a-f0-9-]+)', url) else None
+            variant_match = VARIANT_ID_RE.search(url)
+            variant_id = variant_match.group(1) if variant_match else None
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=PRODUCT_PAGE_STRAINER)
             result = {
                 'url': url,
                 'variant_id': variant_id,
@@ -279,34 +411,33 @@ def scrape_product_page(driver: webdriver.Chrome, url: str) -> Dict[str, Any]:
             }
 
             # Product header
-            product_header = soup.find('div', class_=re.compile(r'relative\s+flex\s+w-full'))
+            product_header = soup.find('div', class_=PRODUCT_HEADER_RE)
             if product_header:
                 name_tag = product_header.find('h1', class_='text-xl')
-                price_tag = product_header.find('span', class_=re.compile(r'text-[^/]\s+font-medium'))
+                price_tag = product_header.find('span', class_=PRICE_CLASS_RE)
                 if name_tag:
-                    result["name"] = name_tag.get_text(strip=True)
+                    result["name"] = tag_text(name_tag)
                 if price_tag:
-                    price_text = price_tag.get_text(strip=True).replace("₹", "").replace(",", "")
+                    price_text = tag_text(price_tag).replace("₹", "").replace(",", "")
                     result["price"] = price_text
 
             # Product details
-            for section in ['productHighlights', 'productInformationL4']:
-                container = soup.find('div', id=section)
+            for section_selector in DETAIL_SECTION_SELECTORS:
+                container = soup.select_one(section_selector)
                 if container:
-                    for div in container.find_all("div", class_="flex items-start gap-3"):
-                        key_tag = div.find("h3")
-                        value_tag = div.find("p")
+                    for div in container.select(DETAIL_ROW_SELECTOR):
+                        key_tag = div.select_one("h3")
+                        value_tag = div.select_one("p")
                         if key_tag and value_tag:
-                            key = key_tag.get_text(strip=True).lower()
-                            result["details"][key] = value_tag.get_text(strip=True)
+                            key = tag_text(key_tag).lower()
+                            result["details"][key] = tag_text(value_tag)
 
-            # Product images
-            image_container = soup.find('div', class_='no-scrollbar relative flex max-h-full flex-col gap-4 overflow-y-scroll')
+            # Product images, from the first gallery container only
+            image_container = soup.select_one(IMAGE_CONTAINER_SELECTOR)
             if image_container:
                 result["images"] = [
-                    re.sub(r'/tr:[^/]+', '', img['src'])
-                    for img in image_container.find_all('img')
-                    if img.get('src')
+                    IMAGE_TRANSFORM_RE.sub('', img['src'])
+                    for img in image_container.select(PRODUCT_IMAGE_SELECTOR)
                 ]
 
             return convert_to_dict(result)
@@ -320,6 +451,19 @@ def scrape_product_page(driver: webdriver.Chrome, url: str) -> Dict[str, Any]:
     return {}
 
 
+def scrape_product_pages(drivers: queue.Queue, product_urls: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Scrape product pages in parallel, one borrowed driver per worker, yielding results in input order."""
+    def scrape_one(url: str) -> Tuple[str, Dict[str, Any]]:
+        driver = drivers.get()
+        try:
+            return url, scrape_product_page(driver, url)
+        finally:
+            drivers.put(driver)
+
+    with ThreadPoolExecutor(max_workers=drivers.qsize()) as executor:
+        yield from executor.map(scrape_one, product_urls)
+
+
 def save_to_csv(data: List[Dict[str, Any]], filename: str) -> None:
     """Save data to CSV file with error handling."""
     if not data:
@@ -327,7 +471,8 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str) -> None:
 
     try:
         file_exists = os.path.isfile(filename)
-        with open(filename, 'a', newline='', encoding='utf-8') as f:
+        # One buffered write per batch instead of a syscall every 8 KB
+        with open(filename, 'a', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=data[0].keys())
             if not file_exists:
                 writer.writeheader()
@@ -337,13 +482,44 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str) -> None:
         logger.error(f"Failed to save CSV: {e}")
 
 
+def iter_store_products(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every {'product': ..., 'productVariant': ...} entry nested anywhere in data."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get('product'), dict) and isinstance(node.get('productVariant'), dict):
+                yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def get_product_urls_from_next_data(driver: webdriver.Chrome) -> List[str]:
+    """Build product URLs from the page's embedded __NEXT_DATA__ JSON, if present."""
+    try:
+        raw = driver.execute_script(
+            "const el = document.getElementById('__NEXT_DATA__'); return el ? el.textContent : null;")
+        data = orjson.loads(raw) if raw else None
+    except (WebDriverException, ValueError) as e:
+        logger.warning(f"Could not read __NEXT_DATA__: {e}")
+        return []
+
+    urls = (
+        generate_product_url(item['product'].get('name') or '', item['productVariant'].get('id'))
+        for item in iter_store_products(data)
+    )
+    return list(dict.fromkeys(url for url in urls if url))
+
+
 def get_product_urls_from_categorypage(driver: webdriver.Chrome) -> List[str]:
     """Extract product URLs from the current page."""
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    main_section = soup.find('div', class_=re.compile(
-        r'no-scrollbar grid grid-cols-2 content-start gap-y-4 gap-x-2 px-2.5 py-4 '
-        r'md:grid-cols-3 md:gap-x-3 md:p-3 lg:grid-cols-5 xl:grid-cols-6'
-    ))
+    product_urls = get_product_urls_from_next_data(driver)
+    if product_urls:
+        return product_urls
+
+    soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=PRODUCT_GRID_STRAINER)
+    main_section = soup.find('div', class_=PRODUCT_GRID_RE)
 
     return [
         BASE_URL + a['href']
@@ -351,36 +527,49 @@ def get_product_urls_from_categorypage(driver: webdriver.Chrome) -> List[str]:
     ] if main_section else []
 
 
-def update_csv_with_product_data(driver: webdriver.Chrome, csv_path: str) -> None:
+def update_csv_with_product_data(drivers: queue.Queue, csv_path: str) -> None:
     """Update CSV file with product page data."""
+    df = None
     try:
         df = pd.read_csv(csv_path)
         processed_count = 0
         total_rows = len(df)
 
+        rows = [
+            i for i in range(processed_count, total_rows)
+            if 'product_url' in df.columns and pd.notna(df.at[i, 'product_url'])
+        ]
+
         with tqdm(total=total_rows, initial=processed_count,
-                 desc="Processing API Products", unit="product") as pbar:
-            for i in range(processed_count, total_rows):
-                product_url = df.at[i, 'product_url'] if 'product_url' in df.columns else None
-                if pd.notna(product_url):
-                    product_data = scrape_product_page(driver, product_url)
-                    if product_data:
-                        for field in ['nutritional_info', 'allergen', 'ingredients','dietary_preference']:
-                            df.at[i, field] = product_data.get(field)
-
-                df.to_csv(csv_path, index=False)
+                 desc="Processing API Products", unit="product",
+                 mininterval=1.0, smoothing=0) as pbar:
+            pbar.update(total_rows - processed_count - len(rows))
+            results = scrape_product_pages(drivers, [df.at[i, 'product_url'] for i in rows])
+            for done, (i, (_, product_data)) in enumerate(zip(rows, results), 1):
+                if product_data:
+                    for field in ['nutritional_info', 'allergen', 'ingredients','dietary_preference']:
+                        df.at[i, field] = product_data.get(field)
+
+                if done % CSV_BATCH_SIZE == 0:
+                    df.to_csv(csv_path, index=False)
                 pbar.update(1)
 
     except Exception as e:
         logger.error(f"[✖] Error processing file: {str(e)}")
         raise
+    finally:
+        # Rows scraped since the last checkpoint are written even when scraping fails
+        if df is not None:
+            df.to_csv(csv_path, index=False)
 
 
 def scrape_zepto_category(url: str, filename: str) -> None:
     """Main function to scrape a Zepto category."""
     driver = None
+    drivers = queue.Queue()
+    pending = []
     try:
-        driver = init_driver()
+        driver = init_driver(capture_network=True)
         logger.info(f"Starting scraping for URL: {url}")
         print(f"Starting scraping for URL: {url}")
 
@@ -392,23 +581,36 @@ def scrape_zepto_category(url: str, filename: str) -> None:
         logger.info(f"Found {len(product_urls)} initial product URLs")
 
         capture_ajax_data(driver, filename)
-        time.sleep(SCROLL_PAUSE_TIME + random.random())
+        time.sleep(random.uniform(*JITTER_RANGE))
+
+        # The category driver would keep logging network events, so the pool gets fresh ones
+        driver.quit()
+        driver = None
+        for _ in range(POOL_SIZE):
+            try:
+                drivers.put(init_driver())
+            except WebDriverException as e:
+                logger.error(f"Failed to start pooled driver: {e}")
 
         if os.path.isfile(filename):
-            update_csv_with_product_data(driver, filename)
+            update_csv_with_product_data(drivers, filename)
 
         total_rows = len(product_urls)
         successful_scrapes = 0
 
         with tqdm(total=total_rows, initial=successful_scrapes,
-                  desc="Processing Category Products", unit="product") as pbar:
-            for i, product_url in enumerate(product_urls, 1):
-                product_data = scrape_product_page(driver, product_url)
+                  desc="Processing Category Products", unit="product",
+                  mininterval=1.0, smoothing=0) as pbar:
+            results = scrape_product_pages(drivers, product_urls)
+            for i, (product_url, product_data) in enumerate(results, 1):
                 pbar.set_postfix({
                     'Current': product_url
-                })
+                }, refresh=False)
                 if product_data:
-                    save_to_csv([product_data], filename)
+                    pending.append(product_data)
+                    if len(pending) >= CSV_BATCH_SIZE:
+                        save_to_csv(pending, filename)
+                        pending.clear()
                     successful_scrapes += 1
                     logger.info(f"Scraped product {i}/{len(product_urls)}")
                 else:
@@ -423,6 +625,11 @@ def scrape_zepto_category(url: str, filename: str) -> None:
     except Exception as e:
         logger.error(f"Critical error: {e}", exc_info=True)
     finally:
+        save_to_csv(pending, filename)
+        while not drivers.empty():
+            pooled = drivers.get()
+            if pooled is not driver:
+                pooled.quit()
         if driver:
             driver.quit()
 